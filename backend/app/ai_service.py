@@ -17,10 +17,25 @@ class AIService:
         self.api_key = os.getenv("AI_API_KEY")
         self.model = os.getenv("AI_MODEL", "gpt-4o-mini")
         self.base_url = os.getenv("AI_BASE_URL")  # For custom endpoints
+        self._http: Optional[httpx.AsyncClient] = None
         
         if not self.api_key:
             logger.warning("AI_API_KEY not configured. Conversational scheduling will be disabled.")
     
+    def _client(self) -> httpx.AsyncClient:
+        """Shared client so repeated LLM calls reuse pooled TLS connections."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def parse_scheduling_request(
         self,
         user_message: str,
@@ -74,28 +89,28 @@ class AIService:
             {"role": "user", "content": user_message}
         ]
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{base_url}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": 0.3,
-                    "response_format": {"type": "json_object"},
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            content = result["choices"][0]["message"]["content"]
-            parsed = json.loads(content)
-            
-            # Post-process the parsed data
-            return self._post_process_parsed_data(parsed, user_timezone)
+        client = self._client()
+        response = await client.post(
+            f"{base_url}/chat/completions",
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "messages": messages,
+                "temperature": 0.3,
+                "response_format": {"type": "json_object"},
+            },
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        content = result["choices"][0]["message"]["content"]
+        parsed = json.loads(content)
+        
+        # Post-process the parsed data
+        return self._post_process_parsed_data(parsed, user_timezone)
     
     async def _parse_with_anthropic(
         self,
@@ -108,33 +123,33 @@ class AIService:
         
         system_prompt = self._get_system_prompt(user_timezone)
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{base_url}/messages",
-                headers={
-                    "x-api-key": self.api_key,
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "system": system_prompt,
-                    "messages": [
-                        {"role": "user", "content": user_message}
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.3,
-                },
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-            content = result["content"][0]["text"]
-            # Anthropic doesn't enforce JSON mode, so we need to extract JSON
-            parsed = self._extract_json_from_text(content)
-            
-            # Post-process the parsed data
-            return self._post_process_parsed_data(parsed, user_timezone)
+        client = self._client()
+        response = await client.post(
+            f"{base_url}/messages",
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "system": system_prompt,
+                "messages": [
+                    {"role": "user", "content": user_message}
+                ],
+                "max_tokens": 2000,
+                "temperature": 0.3,
+            },
+        )
+        response.raise_for_status()
+        result = response.json()
+        
+        content = result["content"][0]["text"]
+        # Anthropic doesn't enforce JSON mode, so we need to extract JSON
+        parsed = self._extract_json_from_text(content)
+        
+        # Post-process the parsed data
+        return self._post_process_parsed_data(parsed, user_timezone)
     
     def _get_system_prompt(self, user_timezone: Optional[str] = None) -> str:
         """Generate the system prompt for the LLM."""
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional
 import os
 
@@ -6,7 +7,7 @@ from fastapi import HTTPException, Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt, JWTError
 
-from .services import UserService
+from .services import USER_CACHE_TTL_MS, UserService
 
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "change-me")
 JWT_ALGORITHM = "HS256"
@@ -24,9 +25,15 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
 security = HTTPBearer(auto_error=False)
 
 
+@lru_cache(maxsize=None)
+def get_user_service() -> UserService:
+    """One UserService for all requests; built on first use, after the database connects."""
+    return UserService()
+
+
 async def get_current_user_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_service: UserService = Depends(lambda: UserService())
+    user_service: UserService = Depends(get_user_service)
 ):
     if credentials is None:
         raise HTTPException(status_code=401, detail="Not authenticated")
@@ -39,7 +46,7 @@ async def get_current_user_token(
     except JWTError as exc:
         raise HTTPException(status_code=401, detail="Invalid token") from exc
 
-    user = await user_service.get_user_by_google_sub(sub)
+    user = await user_service.get_user_by_google_sub(sub, ttl_ms=USER_CACHE_TTL_MS)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -47,7 +54,7 @@ async def get_current_user_token(
 
 async def get_optional_user_token(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    user_service: UserService = Depends(lambda: UserService())
+    user_service: UserService = Depends(get_user_service)
 ):
     if credentials is None:
         return None
@@ -60,7 +67,7 @@ async def get_optional_user_token(
     except JWTError as exc:
         raise HTTPException(status_code=401, detail="Invalid token") from exc
 
-    user = await user_service.get_user_by_google_sub(sub)
+    user = await user_service.get_user_by_google_sub(sub, ttl_ms=USER_CACHE_TTL_MS)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, Hashable, Optional, Tuple
+import time
+
+MISSING = object()
+
+
+class TTLCache:
+    """Small in-process cache; freshness is decided by the caller's TTL."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, ttl_ms: int) -> Any:
+        """Return the cached value, or MISSING if absent or older than ttl_ms."""
+        if ttl_ms <= 0:
+            return MISSING
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        fetched_at, value = entry
+        if time.monotonic() - fetched_at >= ttl_ms / 1000:
+            self._entries.pop(key, None)
+            return MISSING
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value; call after the query returns so the stamp is accurate."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Per-request memo of database reads; None outside an HTTP request
+request_cache: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar("request_cache", default=None)
+
+
+class RequestCacheMiddleware:
+    """Pure ASGI middleware giving every HTTP request a fresh request_cache dict."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = request_cache.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_cache.reset(token)
@@ -3,19 +3,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from .google_calendar import dict_to_credentials
-
-
-def _build_service(credentials_dict: Dict[str, Any]):
-    creds = dict_to_credentials(credentials_dict)
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+from .google_calendar import get_calendar_service
 
 
 def list_events(credentials_dict: Dict[str, Any], time_min: datetime, time_max: datetime) -> List[Dict[str, Any]]:
-    service = _build_service(credentials_dict)
+    service = get_calendar_service(credentials_dict)
     events_service = service.events()
     events: List[Dict[str, Any]] = []
     page_token = None
@@ -36,7 +30,7 @@ def list_events(credentials_dict: Dict[str, Any], time_min: datetime, time_max:
 
 
 def get_free_busy(credentials_dict: Dict[str, Any], time_min: datetime, time_max: datetime) -> List[Dict[str, Any]]:
-    service = _build_service(credentials_dict)
+    service = get_calendar_service(credentials_dict)
     request = {
         "timeMin": time_min.isoformat(),
         "timeMax": time_max.isoformat(),
@@ -1,15 +1,32 @@
 import os
 from datetime import timezone
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo.errors import ConnectionFailure
+from pymongo import ReadPreference
+from pymongo.read_concern import ReadConcern
+from pymongo.errors import ConnectionFailure, PyMongoError
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# (collection, keys, options) for every index the services rely on
+INDEXES = [
+    ("meetings", [("start_time", 1), ("end_time", 1)], {}),
+    ("meetings", [("status", 1), ("end_time", 1)], {}),
+    ("meetings", [("metadata.room_id", 1), ("start_time", 1), ("end_time", 1)], {}),
+    ("meetings", "emails_all", {}),
+    ("polls", "meeting_id", {}),
+    ("polls", [("status", 1), ("deadline", 1)], {}),
+    # Only Google-linked users carry a google_sub; others must not collide on null
+    ("users", "google_sub", {"unique": True, "partialFilterExpression": {"google_sub": {"$type": "string"}}}),
+    ("metadata", "key", {"unique": True}),
+    ("users", "email", {"unique": True}),
+]
+
 class MongoDB:
     client: Optional[AsyncIOMotorClient] = None
     database = None
+    _indexes_ready: bool = False
     # 
     @classmethod
     async def connect_to_mongo(cls):
@@ -22,6 +39,9 @@ class MongoDB:
                 mongo_url,
                 tz_aware=True,
                 tzinfo=timezone.utc,
+                # Keep warm connections so the first requests skip connection setup
+                minPoolSize=int(os.getenv("MONGODB_MIN_POOL_SIZE", "10")),
+                maxPoolSize=int(os.getenv("MONGODB_MAX_POOL_SIZE", "100")),
             )
             cls.database = cls.client[database_name]
             
@@ -35,6 +55,18 @@ class MongoDB:
             logger.error(f"Unexpected error connecting to MongoDB: {e}")
             raise
 
+    @classmethod
+    async def ensure_indexes(cls):
+        """Create the indexes backing service lookups (once per process)."""
+        if cls._indexes_ready:
+            return
+        for collection_name, keys, options in INDEXES:
+            try:
+                await cls.get_collection(collection_name).create_index(keys, **options)
+            except PyMongoError as e:
+                logger.warning(f"Failed to create index {keys} on {collection_name}: {e}")
+        cls._indexes_ready = True
+
     @classmethod
     async def close_mongo_connection(cls):
         """Close database connection."""
@@ -53,6 +85,13 @@ def get_meetings_collection():
     """Get the meetings collection."""
     return MongoDB.get_collection("meetings")
 
+def get_meetings_collection_ro():
+    """Get the meetings collection for list reads that tolerate replica lag."""
+    return get_meetings_collection().with_options(
+        read_preference=ReadPreference.SECONDARY_PREFERRED,
+        read_concern=ReadConcern("local"),
+    )
+
 def get_users_collection():
     """Get the users collection."""
     return MongoDB.get_collection("users")
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
+import hashlib
 import os
+import threading
 from uuid import uuid4
 from datetime import datetime
 
@@ -96,6 +99,35 @@ def dict_to_credentials(data: Dict[str, Any]) -> Credentials:
     )
 
 
+SERVICE_CACHE_SIZE = 64
+_thread_local = threading.local()
+
+
+def get_calendar_service(creds_dict: Dict[str, Any]):
+    """Return a Calendar API client for these credentials, reused per worker thread.
+
+    The client's httplib2 connection is not thread-safe, so each thread keeps its
+    own small cache keyed by a hash of the refresh token. Reusing it skips the
+    discovery build and keeps the TLS connection to Google open between calls.
+    """
+    refresh_token = creds_dict.get("refresh_token")
+    if not refresh_token:
+        return build("calendar", "v3", credentials=dict_to_credentials(creds_dict), cache_discovery=False)
+    key = hashlib.sha256(f"{creds_dict.get('client_id')}:{refresh_token}".encode()).hexdigest()
+    services = getattr(_thread_local, "services", None)
+    if services is None:
+        services = _thread_local.services = OrderedDict()
+    service = services.get(key)
+    if service is None:
+        service = build("calendar", "v3", credentials=dict_to_credentials(creds_dict), cache_discovery=False)
+        services[key] = service
+        while len(services) > SERVICE_CACHE_SIZE:
+            services.popitem(last=False)
+    else:
+        services.move_to_end(key)
+    return service
+
+
 @dataclass
 class CreatedEvent:
     event_id: str
@@ -114,8 +146,7 @@ def create_event_with_meet(
     timezone: str = "UTC",
     send_updates: str = "all",
 ) -> CreatedEvent:
-    creds = dict_to_credentials(creds_dict)
-    service = build("calendar", "v3", credentials=creds)
+    service = get_calendar_service(creds_dict)
 
     body = {
         "summary": title,
@@ -165,8 +196,7 @@ def create_calendar_event(
     location: Optional[str] = None,
     send_updates: str = "all",
 ) -> CreatedEvent:
-    creds = dict_to_credentials(creds_dict)
-    service = build("calendar", "v3", credentials=creds)
+    service = get_calendar_service(creds_dict)
 
     body: Dict[str, Any] = {
         "summary": title,
@@ -195,32 +225,42 @@ def create_calendar_event(
     )
 
 
-def update_event_attendees(
+# Google rejects batches with more than 1000 calls.
+BATCH_MAX_CALLS = 1000
+
+
+def update_events_attendees(
     creds_dict: Dict[str, Any],
+    attendees_by_event: Dict[str, List[str]],
     *,
-    event_id: str,
-    attendees: List[str],
     send_updates: str = "all",
-) -> Dict[str, Any]:
-    """Update attendees for an existing Google Calendar event.
+) -> Dict[str, Optional[Exception]]:
+    """Update attendees on several events with batched HTTP requests.
 
-    Returns the updated event resource.
+    Each batch is a single multipart request of up to BATCH_MAX_CALLS patches.
+    Returns the error (or None) for every event id.
     """
-    creds = dict_to_credentials(creds_dict)
-    service = build("calendar", "v3", credentials=creds)
-
-    body = {"attendees": [{"email": e} for e in attendees]}
-    updated = (
-        service.events()
-        .patch(
-            calendarId="primary",
-            eventId=event_id,
-            body=body,
-            sendUpdates=send_updates,
-        )
-        .execute()
-    )
-    return updated
+    service = get_calendar_service(creds_dict)
+    results: Dict[str, Optional[Exception]] = {}
+
+    def _record(request_id: str, _response: Any, exception: Optional[Exception]) -> None:
+        results[request_id] = exception
+
+    items = list(attendees_by_event.items())
+    for offset in range(0, len(items), BATCH_MAX_CALLS):
+        batch = service.new_batch_http_request(callback=_record)
+        for event_id, attendees in items[offset:offset + BATCH_MAX_CALLS]:
+            batch.add(
+                service.events().patch(
+                    calendarId="primary",
+                    eventId=event_id,
+                    body={"attendees": [{"email": e} for e in attendees]},
+                    sendUpdates=send_updates,
+                ),
+                request_id=event_id,
+            )
+        batch.execute()
+    return results
 
 
 def update_event(
@@ -236,8 +276,7 @@ def update_event(
     send_updates: str = "all",
 ) -> Dict[str, Any]:
     """Patch an existing Google Calendar event with provided fields."""
-    creds = dict_to_credentials(creds_dict)
-    service = build("calendar", "v3", credentials=creds)
+    service = get_calendar_service(creds_dict)
 
     body: Dict[str, Any] = {}
     if title is not None:
@@ -276,8 +315,7 @@ def delete_event(
     send_updates: str = "all",
 ) -> None:
     """Delete a Google Calendar event."""
-    creds = dict_to_credentials(creds_dict)
-    service = build("calendar", "v3", credentials=creds)
+    service = get_calendar_service(creds_dict)
     service.events().delete(
         calendarId="primary",
         eventId=event_id,
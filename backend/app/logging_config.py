@@ -0,0 +1,27 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Route all log records through a queue drained by a background thread.
+
+    Handlers on the event loop thread only enqueue, so a slow stderr never blocks a
+    request. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stderr)
+    stream.setFormatter(logging.Formatter("%(levelname)s:%(name)s:%(message)s"))
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -1,12 +1,18 @@
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Annotated
-from pydantic import BaseModel, Field, BeforeValidator
+from pydantic import BaseModel, Field, BeforeValidator, PrivateAttr, model_validator
 from bson import ObjectId
 import uuid
 
 def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
+def as_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes as UTC and convert aware ones to UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
 def validate_object_id(v):
     if isinstance(v, ObjectId):
         return v
@@ -51,6 +57,19 @@ class Meeting(MongoModel):
     updated_at: datetime = Field(default_factory=utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+class ParticipantSummary(BaseModel):
+    email: str
+
+class MeetingSummary(MongoModel):
+    """Lightweight meeting view for list screens (see MEETING_SUMMARY_PROJECTION)."""
+    title: str
+    participants: List[ParticipantSummary] = []
+    start_time: datetime
+    end_time: datetime
+    status: str = "scheduled"
+    organizer_email: Optional[str] = None
+    updated_at: datetime = Field(default_factory=utcnow)
+
 class MeetingCreate(BaseModel):
     title: str
     description: str
@@ -60,6 +79,26 @@ class MeetingCreate(BaseModel):
     preferred_date: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    _start_ts: float = PrivateAttr(0.0)
+    _end_ts: float = PrivateAttr(0.0)
+
+    @model_validator(mode="after")
+    def _normalize_times(self) -> "MeetingCreate":
+        # Store times as UTC once, with epoch seconds for the route's range checks
+        self.start_time = as_utc(self.start_time)
+        self.end_time = as_utc(self.end_time)
+        self._start_ts = self.start_time.timestamp()
+        self._end_ts = self.end_time.timestamp()
+        return self
+
+    @property
+    def start_ts(self) -> float:
+        return self._start_ts
+
+    @property
+    def end_ts(self) -> float:
+        return self._end_ts
+
 class MeetingUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
@@ -1,20 +1,23 @@
+import asyncio
 import smtplib
 import ssl
+import threading
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Any, Optional
+from typing import Awaitable, Callable, List, Dict, Any, Optional
 import os
 import logging
 from jinja2 import Template
 from .models import Meeting, Participant
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Emails in flight at once during a bulk send
+NOTIFY_CONCURRENCY = 20
+
 class EmailNotificationService:
     def __init__(self):
         # SMTP configuration
@@ -22,11 +25,17 @@ class EmailNotificationService:
         self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
         self.smtp_username = os.getenv("SMTP_USERNAME")
         self.smtp_password = os.getenv("SMTP_PASSWORD")
+        # Socket timeout, so a half-open session can't hold the send lock indefinitely
+        self.smtp_timeout = float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
         self.from_email = os.getenv("FROM_EMAIL", self.smtp_username or "noreply@example.com")
         self.app_name = os.getenv("APP_NAME", "Meeting Scheduler")
         
         if not self.smtp_username or not self.smtp_password:
             logger.warning("SMTP credentials not configured. Email notifications will not be sent.")
+
+        # One logged-in SMTP session reused across sends; smtplib is not thread-safe
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._smtp_lock = threading.Lock()
         
         # Email templates
         self.templates = {
@@ -260,12 +269,8 @@ class EmailNotificationService:
             html_part = MIMEText(html_content, 'html')
             msg.attach(html_part)
 
-            # Create secure connection with server and send email
-            context = ssl.create_default_context()
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls(context=context)
-                server.login(self.smtp_username, self.smtp_password)
-                server.send_message(msg)
+            # smtplib blocks, so deliver from a worker thread
+            await asyncio.to_thread(self._deliver, msg)
 
             logger.info(f"Email sent successfully via SMTP to {to_email}")
             return True
@@ -274,6 +279,66 @@ class EmailNotificationService:
             logger.error(f"Failed to send email via SMTP to {to_email}: {str(e)}")
             return False
 
+    def _connect(self) -> smtplib.SMTP:
+        # Create secure connection with server
+        context = ssl.create_default_context()
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=self.smtp_timeout)
+        try:
+            server.starttls(context=context)
+            server.login(self.smtp_username, self.smtp_password)
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def _discard(self) -> None:
+        """Drop the shared session without a QUIT round trip; the caller holds the lock"""
+        if self._smtp is not None:
+            self._smtp.close()
+            self._smtp = None
+
+    def _deliver(self, msg: MIMEMultipart) -> None:
+        """Send over the shared session, reconnecting once if the server dropped it"""
+        with self._smtp_lock:
+            try:
+                if self._smtp is None:
+                    self._smtp = self._connect()
+                try:
+                    self._smtp.send_message(msg)
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    self._discard()
+                    self._smtp = self._connect()
+                    self._smtp.send_message(msg)
+            except BaseException:
+                # Never reuse a session left in an unknown state
+                self._discard()
+                raise
+
+    def close(self) -> None:
+        """Log out of the shared SMTP session (called at shutdown)"""
+        with self._smtp_lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._smtp = None
+
+    async def send_to_participants(
+        self,
+        participants: List[Participant],
+        send: Callable[[Participant], Awaitable[bool]],
+    ) -> Dict[str, bool]:
+        """Run send() for every participant concurrently, NOTIFY_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(NOTIFY_CONCURRENCY)
+
+        async def _send_one(participant: Participant) -> bool:
+            async with semaphore:
+                return await send(participant)
+
+        sent = await asyncio.gather(*(_send_one(p) for p in participants), return_exceptions=True)
+        return {p.email: ok is True for p, ok in zip(participants, sent)}
+
     async def send_meeting_invitation(self, meeting: Meeting, participant: Participant) -> bool:
         """Send meeting invitation to a participant"""
         try:
@@ -379,17 +444,31 @@ class EmailNotificationService:
 
     async def send_bulk_invitations(self, meeting: Meeting) -> Dict[str, bool]:
         """Send invitations to all meeting participants"""
-        results = {}
-        for participant in meeting.participants:
-            results[participant.email] = await self.send_meeting_invitation(meeting, participant)
-        return results
+        return await self.send_to_participants(
+            meeting.participants,
+            lambda participant: self.send_meeting_invitation(meeting, participant),
+        )
 
     async def send_bulk_reminders(self, meeting: Meeting, hours_before: int = 1) -> Dict[str, bool]:
         """Send reminders to all meeting participants"""
-        results = {}
-        for participant in meeting.participants:
-            results[participant.email] = await self.send_meeting_reminder(meeting, participant, hours_before)
-        return results
+        return await self.send_to_participants(
+            meeting.participants,
+            lambda participant: self.send_meeting_reminder(meeting, participant, hours_before),
+        )
+
+    async def send_bulk_updates(self, meeting: Meeting, changes_description: str) -> Dict[str, bool]:
+        """Send update notifications to all meeting participants"""
+        return await self.send_to_participants(
+            meeting.participants,
+            lambda participant: self.send_meeting_update(meeting, participant, changes_description),
+        )
+
+    async def send_bulk_cancellations(self, meeting: Meeting, cancellation_reason: str) -> Dict[str, bool]:
+        """Send cancellation notifications to all meeting participants"""
+        return await self.send_to_participants(
+            meeting.participants,
+            lambda participant: self.send_meeting_cancellation(meeting, participant, cancellation_reason),
+        )
 
     async def send_poll_invitation(self, meeting: Meeting, participant: Participant, poll_url: str) -> bool:
         try:
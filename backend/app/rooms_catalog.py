@@ -50,8 +50,8 @@ def list_rooms() -> List[Dict[str, Any]]:
     return ROOMS_CATALOG
 
 
+ROOMS_BY_ID: Dict[str, Dict[str, Any]] = {room["id"]: room for room in ROOMS_CATALOG}
+
+
 def get_room_by_id(room_id: str) -> Optional[Dict[str, Any]]:
-    for room in ROOMS_CATALOG:
-        if room["id"] == room_id:
-            return room
-    return None
+    return ROOMS_BY_ID.get(room_id)
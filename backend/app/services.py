@@ -1,81 +1,289 @@
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, AsyncIterator, Awaitable, Callable, Tuple, TypeVar, Union
 from bson import ObjectId
+from bson.errors import InvalidId
+from collections import Counter
+from functools import lru_cache
 from motor.motor_asyncio import AsyncIOMotorCollection
 from pymongo import ReturnDocument
+from pymongo.errors import PyMongoError
+from pydantic import ValidationError
+import asyncio
+import os
 import uuid
 import logging
-from .database import get_meetings_collection, get_metadata_collection, get_users_collection, get_polls_collection
+from .cache import MISSING, TTLCache, request_cache
+from .database import get_meetings_collection, get_meetings_collection_ro, get_metadata_collection, get_users_collection, get_polls_collection
 from .meet_link import generate_google_meet_link
 from .google_calendar import create_event_with_meet
-from .models import Meeting, MeetingCreate, MeetingUpdate, Metadata, User, Poll, PollOption, PollVote
+from .models import (
+    Meeting, MeetingCreate, MeetingSummary, MeetingUpdate, Metadata, Participant, ParticipantSummary,
+    User, Poll, PollOption, PollVote, TimeSlot, as_utc, utcnow,
+)
 from .rooms_catalog import ROOMS_CATALOG, get_room_by_id
 
 logger = logging.getLogger(__name__)
 
+MeetingT = TypeVar("MeetingT", Meeting, MeetingSummary)
+
+# Cursor batch sizes: list endpoints vs. full-collection reads
+LIST_BATCH_SIZE = 500
+FULL_SCAN_BATCH_SIZE = 2000
+
+# Repeated list/availability reads within this window share one query
+LIST_CACHE_TTL_MS = 500
+
+# Single-meeting reads by read-only endpoints (detail view, notification sends)
+MEETING_CACHE_SIZE = 1024
+MEETING_CACHE_TTL_MS = 2_000
+
+# Metadata entries change rarely; the metadata route tolerates this much staleness
+METADATA_CACHE_SIZE = 256
+METADATA_CACHE_TTL_MS = 30_000
+# Notification job records change state while clients poll them, and the update may
+# run in another worker; they are always read from the database
+NOTIFICATION_JOB_KEY_PREFIX = "notify:"
+
+# User lookups made on every authenticated request; writes in this process evict
+USER_CACHE_SIZE = 1024
+USER_CACHE_TTL_MS = 60_000
+
+# Marker in meeting metadata held while one sync creates the Google event; a claim
+# older than the TTL is treated as abandoned (the worker died mid-create)
+GOOGLE_SYNC_CLAIM_KEY = "google_sync_claimed_at"
+GOOGLE_SYNC_CLAIM_TTL = timedelta(minutes=5)
+
+# Expired polls finalized concurrently per sweep
+FINALIZE_CONCURRENCY = 10
+
+# Above this many new participants, ids are drawn from a single urandom read
+PARTICIPANT_ID_BATCH_THRESHOLD = 32
+
+# Full meeting lists skip participant availability, which list views never show,
+# and the emails_all lookup key
+MEETING_LIST_PROJECTION = {"participants.availability": 0, "emails_all": 0}
+
+# emails_all = organizer + participant emails, so "my meetings" is a single index lookup.
+# Kept in sync server-side by appending {"$set": {"emails_all": EMAILS_ALL_EXPR}} to updates.
+EMAILS_ALL_EXPR = {"$setUnion": [
+    {"$ifNull": ["$participants.email", []]},
+    {"$cond": [{"$ifNull": ["$organizer_email", False]}, ["$organizer_email"], []]},
+]}
+
+# Room conflict checks only report which meeting holds the room and when
+ROOM_CONFLICT_PROJECTION = {"title": 1, "start_time": 1, "end_time": 1, "status": 1, "metadata.room_id": 1}
+
+# Fields needed to render a meeting in list views
+MEETING_SUMMARY_PROJECTION = {
+    "title": 1,
+    "start_time": 1,
+    "end_time": 1,
+    "status": 1,
+    "organizer_email": 1,
+    "updated_at": 1,
+    "participants.email": 1,
+}
+
+
+def _literal_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap values for a pipeline-update $set so they are stored as-is, not evaluated."""
+    return {key: {"$literal": value} for key, value in fields.items()}
+
+
+def _log_db_error(action: str, exc: Exception) -> None:
+    """Log a failed DB call; retryable write errors propagate so the driver retries."""
+    if isinstance(exc, PyMongoError) and exc.has_error_label("RetryableWriteError"):
+        raise exc
+    logger.error("%s failed: %s", action, exc)
+
+
+async def _coalesced(
+    inflight: Dict[Any, "asyncio.Future[Any]"],
+    key: Any,
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Share one in-flight fetch between concurrent callers asking for the same key."""
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        inflight[key] = future
+        future.add_done_callback(lambda _: inflight.pop(key, None))
+    # Shield so one caller being cancelled does not cancel the fetch for the others
+    return await asyncio.shield(future)
+
+
+@lru_cache(maxsize=4096)
+def _oid(value: str) -> ObjectId:
+    """Parse an id string once; repeated lookups of the same id reuse it."""
+    return ObjectId(value)
+
+
+# Statuses the time window never changes
+_FIXED_STATUSES = frozenset({"cancelled", "polling"})
+
+# Statuses kept as-is while a meeting is still upcoming
+_UPCOMING_EXPLICIT_STATUSES = frozenset({"rescheduled", "confirmed"})
+
+
+def _status_now() -> datetime:
+    """Current time truncated to the second, the granularity _compute_status caches on."""
+    return utcnow().replace(microsecond=0)
+
+
+@lru_cache(maxsize=4096)
+def _compute_status(status: str, start_time: datetime, end_time: datetime, now: datetime) -> str:
+    """Status a meeting should have at ``now`` (callers truncate it to the second)."""
+    if status in _FIXED_STATUSES:
+        return status
+
+    if start_time <= now < end_time:
+        return "running"
+    if now >= end_time:
+        return "completed"
+
+    # Preserve explicit statuses when upcoming
+    if status in _UPCOMING_EXPLICIT_STATUSES:
+        return status
+
+    return "scheduled"
+
+
+# Reads build models with model_construct: the documents were written by this
+# service, so re-validating every field of every row is wasted work. Nested models
+# are constructed explicitly because model_construct leaves them as plain dicts.
+def _meeting_from_doc(doc: Dict[str, Any]) -> Meeting:
+    participants = [
+        Participant.model_construct(
+            **{**p, "availability": [TimeSlot.model_construct(**slot) for slot in p.get("availability", [])]}
+        )
+        for p in doc.get("participants", [])
+    ]
+    return Meeting.model_construct(**{**doc, "participants": participants})
+
+
+def _meeting_summary_from_doc(doc: Dict[str, Any]) -> MeetingSummary:
+    participants = [ParticipantSummary.model_construct(**p) for p in doc.get("participants", [])]
+    return MeetingSummary.model_construct(**{**doc, "participants": participants})
+
+
+def _poll_from_doc(doc: Dict[str, Any]) -> Poll:
+    return Poll.model_construct(**{
+        **doc,
+        "options": [PollOption.model_construct(**o) for o in doc.get("options", [])],
+        "votes": [PollVote.model_construct(**v) for v in doc.get("votes", [])],
+    })
+
+
+def _new_participant_docs(emails: List[str]) -> List[Dict[str, Any]]:
+    """Build participant documents for the given email addresses."""
+    if len(emails) > PARTICIPANT_ID_BATCH_THRESHOLD:
+        # One urandom read for the whole batch instead of one per uuid4()
+        buf = os.urandom(16 * len(emails))
+        ids = [uuid.UUID(bytes=buf[i:i + 16], version=4).hex for i in range(0, len(buf), 16)]
+    else:
+        ids = [uuid.uuid4().hex for _ in emails]
+    return [
+        {
+            "id": participant_id,
+            "name": email.split('@')[0],
+            "email": email,
+            "availability": []
+        }
+        for participant_id, email in zip(ids, emails)
+    ]
+
+
 class MeetingService:
     def __init__(self):
         self.collection: AsyncIOMotorCollection = get_meetings_collection()
+        self.collection_ro: AsyncIOMotorCollection = get_meetings_collection_ro()
+        # Keyed like the cache, so a read started after a write never joins an older find_one
+        self._inflight: Dict[Tuple[int, ObjectId], "asyncio.Future[Any]"] = {}
+        # Short-lived cache for list/availability reads, keyed by a generation
+        # counter that every meeting write bumps
+        self._generation = 0
+        self._list_cache = TTLCache(maxsize=256)
+        self._list_inflight: Dict[Any, "asyncio.Future[Any]"] = {}
+        # Raw documents, so every caller still gets its own model instance
+        self._meeting_cache = TTLCache(maxsize=MEETING_CACHE_SIZE)
 
-    async def _sync_meeting_status(self, meeting: Meeting) -> Meeting:
-        """Ensure the meeting status reflects its current time window."""
-        try:
-            new_status = self._determine_status(meeting)
-            if new_status != meeting.status:
-                await self.collection.update_one(
-                    {"_id": meeting.id},
-                    {"$set": {"status": new_status, "updated_at": datetime.now(timezone.utc)}}
-                )
-                meeting.status = new_status
-                meeting.updated_at = datetime.now(timezone.utc)
-        except Exception:
-            # If status sync fails, return meeting as-is without blocking request
-            pass
-        return meeting
+    def _invalidate_lists(self) -> None:
+        """Make cached lists, availability and meeting reads stale after a meeting write"""
+        self._generation += 1
 
-    def _determine_status(self, meeting: Meeting) -> str:
-        if meeting.status == "cancelled":
-            return "cancelled"
-        if meeting.status == "polling":
-            return "polling"
+    async def _cached_list(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Serve a list read from the short-lived cache; concurrent misses share one fetch"""
+        key = (self._generation, *key)
+        cached = self._list_cache.get(key, LIST_CACHE_TTL_MS)
+        if cached is not MISSING:
+            return cached
 
-        now = datetime.now(timezone.utc)
-        if meeting.start_time <= now < meeting.end_time:
-            return "running"
-        if now >= meeting.end_time:
-            return "completed"
+        async def _load() -> Any:
+            result = await fetch()
+            self._list_cache.set(key, result)
+            return result
 
-        # Preserve explicit statuses when upcoming
-        if meeting.status in {"rescheduled", "confirmed"}:
-            return meeting.status
+        return await _coalesced(self._list_inflight, key, _load)
 
-        return "scheduled"
+    def _refresh_status(self, meeting: MeetingT, now: Optional[datetime] = None) -> MeetingT:
+        """Set the status implied by the current time window, in memory only.
 
-    async def create_meeting(
+        Stored statuses are brought up to date by sweep_statuses().
+        """
+        if meeting.status not in _FIXED_STATUSES:
+            meeting.status = self._determine_status(meeting, now or _status_now())
+        return meeting
+
+    async def backfill_emails_all(self) -> int:
+        """Populate emails_all on meetings written before it existed; returns the number updated."""
+        result = await self.collection.update_many(
+            {"emails_all": {"$exists": False}},
+            [{"$set": {"emails_all": EMAILS_ALL_EXPR}}],
+        )
+        return result.modified_count
+
+    async def sweep_statuses(self) -> int:
+        """Persist time-driven status transitions for all meetings; returns the number updated."""
+        now = utcnow()
+        started = await self.collection.update_many(
+            {
+                "status": {"$in": ["scheduled", "rescheduled", "confirmed"]},
+                "start_time": {"$lte": now},
+                "end_time": {"$gt": now},
+            },
+            [{"$set": {"status": "running", "updated_at": "$$NOW"}}],
+        )
+        ended = await self.collection.update_many(
+            {
+                "status": {"$nin": ["cancelled", "polling", "completed"]},
+                "end_time": {"$lte": now},
+            },
+            [{"$set": {"status": "completed", "updated_at": "$$NOW"}}],
+        )
+        if started.modified_count or ended.modified_count:
+            self._invalidate_lists()
+        return started.modified_count + ended.modified_count
+
+    def _determine_status(self, meeting: Union[Meeting, MeetingSummary], now: datetime) -> str:
+        return _compute_status(meeting.status, meeting.start_time, meeting.end_time, now)
+
+    async def _build_meeting_doc(
         self,
         meeting_data: MeetingCreate,
-        metadata: Optional[Dict[str, Any]] = None,
-        organizer_email: Optional[str] = None,
-    ) -> Meeting:
-        """Create a new meeting with metadata"""
-        from datetime import timedelta
-        
+        metadata: Optional[Dict[str, Any]],
+        organizer_email: Optional[str],
+        now: datetime,
+    ) -> Dict[str, Any]:
+        """Build the document to insert for a new meeting"""
         # Create participants from email addresses
-        participants = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": email.split('@')[0],
-                "email": email,
-                "availability": []
-            }
-            for email in meeting_data.participants
-        ]
+        participants = _new_participant_docs(meeting_data.participants)
         
         # Calculate duration from start and end times
         duration = int((meeting_data.end_time - meeting_data.start_time).total_seconds() / 60)
         
-        # Prepare metadata and mark this as online by default unless specified
-        meta: Dict[str, Any] = dict(metadata or {})
+        # Prepare metadata and mark this as online by default unless specified.
+        # Callers hand over a fresh dict per request, so it is filled in place.
+        meta: Dict[str, Any] = metadata if metadata is not None else {}
         location_type = meta.get("location_type", "online")
 
         if location_type == "onsite":
@@ -109,212 +317,383 @@ class MeetingService:
             "duration": duration,
             "status": status,
             "organizer_email": organizer_email,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "emails_all": sorted({p["email"] for p in participants} | ({organizer_email} if organizer_email else set())),
+            "created_at": now,
+            "updated_at": now,
             "metadata": meta
         }
-        
+        return meeting_doc
+
+    async def create_meeting(
+        self,
+        meeting_data: MeetingCreate,
+        metadata: Optional[Dict[str, Any]] = None,
+        organizer_email: Optional[str] = None,
+    ) -> Meeting:
+        """Create a new meeting with metadata"""
+        now = utcnow()
+        meeting_doc = await self._build_meeting_doc(meeting_data, metadata, organizer_email, now)
         result = await self.collection.insert_one(meeting_doc)
+        self._invalidate_lists()
         meeting_doc["_id"] = result.inserted_id
-        return Meeting(**meeting_doc)
+        return Meeting.model_validate(meeting_doc)
+
+    async def create_meetings(
+        self,
+        items: List[MeetingCreate],
+        organizer_email: Optional[str] = None,
+    ) -> List[Meeting]:
+        """Create several meetings with a single insert_many round trip"""
+        if not items:
+            return []
+        now = utcnow()
+        docs = [
+            await self._build_meeting_doc(item, item.metadata, organizer_email, now)
+            for item in items
+        ]
+        result = await self.collection.insert_many(docs, ordered=False)
+        self._invalidate_lists()
+        for doc, inserted_id in zip(docs, result.inserted_ids):
+            doc["_id"] = inserted_id
+        return [Meeting.model_validate(doc) for doc in docs]
 
-    async def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
-        """Get a meeting by ID"""
+    async def get_meeting(self, meeting_id: str, ttl_ms: int = 0) -> Optional[Meeting]:
+        """Get a meeting by ID, served from cache when younger than ttl_ms"""
         try:
-            meeting_doc = await self.collection.find_one({"_id": ObjectId(meeting_id)})
+            oid = _oid(meeting_id)
+            key = (self._generation, oid)
+            # Repeat lookups within one HTTP request never go back to Mongo
+            scoped = request_cache.get()
+            meeting_doc = scoped.get(("meeting", key), MISSING) if scoped is not None else MISSING
+            if meeting_doc is MISSING:
+                meeting_doc = self._meeting_cache.get(key, ttl_ms)
+            if meeting_doc is MISSING:
+                meeting_doc = await _coalesced(
+                    self._inflight, key, lambda: self.collection.find_one({"_id": oid})
+                )
+                self._meeting_cache.set(key, meeting_doc)
+            if scoped is not None:
+                scoped[("meeting", key)] = meeting_doc
             if meeting_doc:
-                meeting = Meeting(**meeting_doc)
-                return await self._sync_meeting_status(meeting)
+                return self._refresh_status(_meeting_from_doc(meeting_doc))
             return None
-        except Exception:
+        except InvalidId:
+            return None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("get_meeting", exc)
             return None
 
-    async def get_all_meetings(self, user_email: Optional[str] = None) -> List[Meeting]:
-        """Get all meetings the user organizes or participates in."""
-        query: Dict[str, Any] = {}
-        if user_email:
-            query = {
-                "$or": [
-                    {"organizer_email": user_email},
-                    {"participants.email": user_email},
-                ]
-            }
+    @staticmethod
+    def _user_meetings_query(user_email: Optional[str]) -> Dict[str, Any]:
+        if not user_email:
+            return {}
+        return {"emails_all": user_email}
 
-        meetings: List[Meeting] = []
-        cursor = self.collection.find(query)
-        async for meeting_doc in cursor:
-            meeting = Meeting(**meeting_doc)
-            meetings.append(await self._sync_meeting_status(meeting))
-        return meetings
+    async def iter_meetings(self, user_email: Optional[str] = None) -> AsyncIterator[Meeting]:
+        """Yield the user's meetings straight off the cursor, without buffering the list."""
+        query = self._user_meetings_query(user_email)
+        cursor = self.collection_ro.find(query, MEETING_LIST_PROJECTION, batch_size=LIST_BATCH_SIZE)
+        now = _status_now()
+        async for doc in cursor:
+            yield self._refresh_status(_meeting_from_doc(doc), now)
+
+    async def get_all_meetings_summary(self, user_email: Optional[str] = None) -> List[MeetingSummary]:
+        """Like iter_meetings, but fetch only the fields list views render, as one list."""
+        query = self._user_meetings_query(user_email)
+        docs = await self.collection_ro.find(
+            query, MEETING_SUMMARY_PROJECTION, batch_size=LIST_BATCH_SIZE
+        ).to_list(length=None)
+        now = _status_now()
+        return [self._refresh_status(_meeting_summary_from_doc(doc), now) for doc in docs]
+
+    async def _merge_update_metadata(
+        self,
+        existing: Meeting,
+        incoming_meta: Optional[Dict[str, Any]],
+        start: datetime,
+        end: datetime,
+    ) -> Dict[str, Any]:
+        """Merge incoming metadata over the stored one and re-check the room booking"""
+        existing_meta = dict(existing.metadata or {})
+        if incoming_meta is not None:
+            merged_meta = {**existing_meta, **incoming_meta}
+        else:
+            merged_meta = dict(existing_meta)
+
+        location_type = merged_meta.get("location_type", existing_meta.get("location_type", "online"))
+        if location_type == "onsite":
+            room_id = merged_meta.get("room_id") or existing_meta.get("room_id")
+            await self._ensure_room_available(room_id, start, end, exclude_meeting_id=existing.id)
+            room = get_room_by_id(room_id) if room_id else None
+            if room:
+                merged_meta.update(
+                    {
+                        "room_id": room_id,
+                        "room_name": room["name"],
+                        "room_capacity": room["capacity"],
+                        "room_location": room["location"],
+                        "room_features": room.get("features", []),
+                        "room_notes": room.get("notes"),
+                    }
+                )
+        else:
+            for key in ("room_id", "room_name", "room_capacity", "room_location", "room_features", "room_notes"):
+                merged_meta.pop(key, None)
+
+        merged_meta["location_type"] = location_type
+        return merged_meta
 
     async def update_meeting(self, meeting_id: str, update_data: MeetingUpdate) -> Optional[Meeting]:
         """Update a meeting"""
         try:
-            existing_doc = await self.collection.find_one({"_id": ObjectId(meeting_id)})
-            if not existing_doc:
-                return None
-            existing = Meeting(**existing_doc)
-
+            oid = _oid(meeting_id)
             update_dict = update_data.model_dump(exclude_unset=True)
             participants_emails = update_dict.pop("participants_emails", None)
             if participants_emails is not None:
-                update_dict["participants"] = [
-                    {
-                        "id": str(uuid.uuid4()),
-                        "name": email.split('@')[0],
-                        "email": email,
-                        "availability": []
-                    }
-                    for email in participants_emails
-                ]
-
-            start = update_dict.get("start_time", existing.start_time)
-            end = update_dict.get("end_time", existing.end_time)
-            if "start_time" in update_dict or "end_time" in update_dict:
-                duration = int((end - start).total_seconds() / 60)
-                update_dict["duration"] = duration
-
-            # Merge metadata (existing + incoming)
-            existing_meta = dict(existing.metadata or {})
-            incoming_meta = update_dict.get("metadata")
-            if incoming_meta is not None:
-                merged_meta = {**existing_meta, **incoming_meta}
-            else:
-                merged_meta = dict(existing_meta)
-
-            location_type = merged_meta.get("location_type", existing_meta.get("location_type", "online"))
-            if location_type == "onsite":
-                room_id = merged_meta.get("room_id") or existing_meta.get("room_id")
-                await self._ensure_room_available(room_id, start, end, exclude_meeting_id=meeting_id)
-                room = get_room_by_id(room_id) if room_id else None
-                if room:
-                    merged_meta.update(
-                        {
-                            "room_id": room_id,
-                            "room_name": room["name"],
-                            "room_capacity": room["capacity"],
-                            "room_location": room["location"],
-                            "room_features": room.get("features", []),
-                            "room_notes": room.get("notes"),
-                        }
-                    )
-            else:
-                for key in ("room_id", "room_name", "room_capacity", "room_location", "room_features", "room_notes"):
-                    merged_meta.pop(key, None)
+                update_dict["participants"] = _new_participant_docs(participants_emails)
 
-            merged_meta["location_type"] = location_type
-            update_dict["metadata"] = merged_meta
-            update_dict["updated_at"] = datetime.now(timezone.utc)
-            
-            result = await self.collection.update_one(
-                {"_id": ObjectId(meeting_id)},
-                {"$set": update_dict}
+            # A null time would null out duration too; keep the stored value instead
+            for field in ("start_time", "end_time"):
+                if field in update_dict and update_dict[field] is None:
+                    del update_dict[field]
+            times_changed = "start_time" in update_dict or "end_time" in update_dict
+            # Only metadata and time changes need the stored meeting (merge + room check)
+            if times_changed or "metadata" in update_dict:
+                existing_doc = await self.collection.find_one({"_id": oid})
+                if not existing_doc:
+                    return None
+                existing = Meeting.model_validate(existing_doc)
+                update_dict["metadata"] = await self._merge_update_metadata(
+                    existing,
+                    update_dict.get("metadata"),
+                    update_dict.get("start_time", existing.start_time),
+                    update_dict.get("end_time", existing.end_time),
+                )
+
+            pipeline: List[Dict[str, Any]] = [
+                {"$set": {**_literal_fields(update_dict), "updated_at": "$$NOW"}},
+            ]
+            if "participants" in update_dict:
+                pipeline.append({"$set": {"emails_all": EMAILS_ALL_EXPR}})
+            if times_changed:
+                # Duration in whole minutes, from whichever times are now stored
+                pipeline.append({"$set": {"duration": {"$toInt": {
+                    "$divide": [{"$subtract": ["$end_time", "$start_time"]}, 60000]
+                }}}})
+
+            meeting_doc = await self.collection.find_one_and_update(
+                {"_id": oid},
+                pipeline,
+                return_document=ReturnDocument.AFTER,
             )
-            
-            if result.modified_count > 0:
-                return await self.get_meeting(meeting_id)
+            self._invalidate_lists()
+            if not meeting_doc:
+                return None
+            return self._refresh_status(Meeting.model_validate(meeting_doc))
+        except InvalidId:
             return None
-        except ValueError:
-            raise
-        except Exception:
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("update_meeting", exc)
             return None
 
-    async def delete_meeting(self, meeting_id: str) -> bool:
-        """Delete a meeting"""
+    async def delete_meeting(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """Delete a meeting, returning the deleted document's _id and metadata (None if absent)"""
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(meeting_id)})
-            return result.deleted_count > 0
-        except Exception:
+            deleted = await self.collection.find_one_and_delete(
+                {"_id": _oid(meeting_id)}, projection={"metadata": 1}
+            )
+            self._invalidate_lists()
+            return deleted
+        except InvalidId:
+            return None
+        except PyMongoError as exc:
+            _log_db_error("delete_meeting", exc)
+            return None
+
+    async def claim_google_event(self, meeting_id: str) -> bool:
+        """Reserve creation of the meeting's Google event across workers.
+
+        False when the meeting is gone, already has an event, or another sync holds a
+        live claim. The winner clears GOOGLE_SYNC_CLAIM_KEY with set_meeting_metadata_fields.
+        """
+        try:
+            result = await self.collection.update_one(
+                {
+                    "_id": _oid(meeting_id),
+                    "metadata.google_event_id": None,
+                    "$or": [
+                        {f"metadata.{GOOGLE_SYNC_CLAIM_KEY}": None},
+                        {f"metadata.{GOOGLE_SYNC_CLAIM_KEY}": {"$lt": utcnow() - GOOGLE_SYNC_CLAIM_TTL}},
+                    ],
+                },
+                [{"$set": {"metadata": {"$mergeObjects": [
+                    {"$ifNull": ["$metadata", {}]},
+                    {GOOGLE_SYNC_CLAIM_KEY: "$$NOW"},
+                ]}}}],
+            )
+        except InvalidId:
             return False
+        except PyMongoError as exc:
+            _log_db_error("claim_google_event", exc)
+            return False
+        if result.modified_count:
+            self._invalidate_lists()
+        return result.modified_count == 1
 
     async def update_meeting_metadata(self, meeting_id: str, metadata: Dict[str, Any]) -> Optional[Meeting]:
         """Update meeting metadata"""
         try:
-            result = await self.collection.update_one(
-                {"_id": ObjectId(meeting_id)},
-                {
-                    "$set": {
-                        "metadata": metadata,
-                        "updated_at": datetime.now(timezone.utc)
-                    }
-                }
+            meeting_doc = await self.collection.find_one_and_update(
+                {"_id": _oid(meeting_id)},
+                [{"$set": {"metadata": {"$literal": metadata}, "updated_at": "$$NOW"}}],
+                return_document=ReturnDocument.AFTER,
             )
-            
-            if result.modified_count > 0:
-                return await self.get_meeting(meeting_id)
+            self._invalidate_lists()
+            if not meeting_doc:
+                return None
+            return self._refresh_status(Meeting.model_validate(meeting_doc))
+        except InvalidId:
             return None
-        except Exception:
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("update_meeting_metadata", exc)
             return None
 
-    async def add_participants(self, meeting_id: str, emails: List[str]) -> Optional[Meeting]:
-        """Add new participants (by email) to a meeting"""
-        meeting = await self.get_meeting(meeting_id)
-        if not meeting:
-            return None
-
-        existing_emails = {p.email for p in meeting.participants}
-        to_add = [e for e in emails if e not in existing_emails]
-        if not to_add:
-            return meeting
-
-        new_participants = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": email.split('@')[0],
-                "email": email,
-                "availability": []
-            }
-            for email in to_add
+    async def set_meeting_metadata_fields(
+        self,
+        meeting_id: str,
+        fields: Dict[str, Any],
+        remove: Optional[List[str]] = None,
+    ) -> Optional[Meeting]:
+        """Set and/or remove individual metadata keys without rewriting the rest"""
+        pipeline: List[Dict[str, Any]] = [
+            {"$set": {
+                **{f"metadata.{key}": {"$literal": value} for key, value in fields.items()},
+                "updated_at": "$$NOW",
+            }},
         ]
+        if remove:
+            pipeline.append({"$unset": [f"metadata.{key}" for key in remove]})
+        try:
+            meeting_doc = await self.collection.find_one_and_update(
+                {"_id": _oid(meeting_id)},
+                pipeline,
+                return_document=ReturnDocument.AFTER,
+            )
+            self._invalidate_lists()
+            if not meeting_doc:
+                return None
+            return self._refresh_status(Meeting.model_validate(meeting_doc))
+        except InvalidId:
+            return None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("set_meeting_metadata_fields", exc)
+            return None
 
-        updated_list = [p.model_dump() for p in meeting.participants] + new_participants
+    async def add_participants(self, meeting_id: str, emails: List[str]) -> Optional[Meeting]:
+        """Add new participants (by email) to a meeting"""
+        candidates = _new_participant_docs(list(dict.fromkeys(emails)))
 
         try:
-            await self.collection.update_one(
-                {"_id": ObjectId(meeting_id)},
-                {"$set": {"participants": updated_list, "updated_at": datetime.now(timezone.utc)}},
+            meeting_doc = await self.collection.find_one_and_update(
+                {"_id": _oid(meeting_id)},
+                [
+                    # Keep only candidates whose email is not already on the meeting
+                    {"$set": {"_new": {"$filter": {
+                        "input": {"$literal": candidates},
+                        "as": "p",
+                        "cond": {"$not": [{"$in": ["$$p.email", {"$ifNull": ["$participants.email", []]}]}]},
+                    }}}},
+                    {"$set": {
+                        "participants": {"$concatArrays": [{"$ifNull": ["$participants", []]}, "$_new"]},
+                        "updated_at": {"$cond": [{"$gt": [{"$size": "$_new"}, 0]}, "$$NOW", "$updated_at"]},
+                    }},
+                    {"$unset": "_new"},
+                    {"$set": {"emails_all": EMAILS_ALL_EXPR}},
+                ],
+                return_document=ReturnDocument.AFTER,
             )
-            return await self.get_meeting(meeting_id)
-        except Exception:
+            self._invalidate_lists()
+            if not meeting_doc:
+                return None
+            return self._refresh_status(Meeting.model_validate(meeting_doc))
+        except InvalidId:
+            return None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("add_participants", exc)
             return None
 
     async def generate_meet_link(self, meeting_id: str) -> Optional[Meeting]:
         """Generate and attach a Google Meet link for the meeting"""
-        meeting = await self.get_meeting(meeting_id)
-        if not meeting:
+        # Link generation is local string work, so the whole change is one update
+        candidate_url = generate_google_meet_link()
+        try:
+            meeting_doc = await self.collection.find_one_and_update(
+                {"_id": _oid(meeting_id)},
+                [{"$set": {
+                    "metadata": {"$mergeObjects": [
+                        {"location_type": "online"},
+                        {"$ifNull": ["$metadata", {}]},
+                        {
+                            "meeting_platform": "google_meet",
+                            # Keep an existing link; otherwise use the new one
+                            "meeting_url": {"$ifNull": ["$metadata.meeting_url", {"$literal": candidate_url}]},
+                        },
+                    ]},
+                    "updated_at": "$$NOW",
+                }}],
+                return_document=ReturnDocument.AFTER,
+            )
+            self._invalidate_lists()
+            if not meeting_doc:
+                return None
+            return self._refresh_status(Meeting.model_validate(meeting_doc))
+        except InvalidId:
+            return None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("generate_meet_link", exc)
             return None
-        meta = dict(meeting.metadata or {})
-        meta.setdefault("location_type", "online")
-        meta["meeting_platform"] = "google_meet"
-        meta["meeting_url"] = meta.get("meeting_url") or generate_google_meet_link()
-        return await self.update_meeting_metadata(meeting_id, meta)
 
-    async def find_room_conflicts(
+    async def find_conflicts_for_rooms(
         self,
-        room_id: str,
+        room_ids: List[str],
         start_time: datetime,
         end_time: datetime,
-        exclude_meeting_id: Optional[str] = None,
-    ) -> List[Meeting]:
+        exclude_meeting_id: Optional[Union[str, ObjectId]] = None,
+    ) -> Dict[str, List[MeetingSummary]]:
+        """Meetings overlapping the window in any of the rooms, grouped by room id"""
         query: Dict[str, Any] = {
-            "metadata.room_id": room_id,
+            "metadata.room_id": {"$in": room_ids},
             "start_time": {"$lt": end_time},
             "end_time": {"$gt": start_time},
         }
         if exclude_meeting_id:
-            query["_id"] = {"$ne": ObjectId(exclude_meeting_id)}
-        conflicts: List[Meeting] = []
-        cursor = self.collection.find(query)
-        async for doc in cursor:
-            conflicts.append(Meeting(**doc))
+            if not isinstance(exclude_meeting_id, ObjectId):
+                exclude_meeting_id = _oid(exclude_meeting_id)
+            query["_id"] = {"$ne": exclude_meeting_id}
+        docs = await self.collection.find(
+            query, ROOM_CONFLICT_PROJECTION, batch_size=LIST_BATCH_SIZE
+        ).to_list(length=None)
+        conflicts: Dict[str, List[MeetingSummary]] = {room_id: [] for room_id in room_ids}
+        for doc in docs:
+            conflicts[doc["metadata"]["room_id"]].append(_meeting_summary_from_doc(doc))
         return conflicts
 
+    async def find_room_conflicts(
+        self,
+        room_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_meeting_id: Optional[Union[str, ObjectId]] = None,
+    ) -> List[MeetingSummary]:
+        conflicts = await self.find_conflicts_for_rooms([room_id], start_time, end_time, exclude_meeting_id)
+        return conflicts[room_id]
+
     async def _ensure_room_available(
         self,
         room_id: Optional[str],
         start_time: datetime,
         end_time: datetime,
-        exclude_meeting_id: Optional[str] = None,
+        exclude_meeting_id: Optional[Union[str, ObjectId]] = None,
     ) -> None:
         if not room_id:
             raise ValueError("Select a room for onsite meetings.")
@@ -332,9 +711,23 @@ class MeetingService:
         end_time: datetime,
         exclude_meeting_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
+        return await self._cached_list(
+            ("rooms", start_time, end_time, str(exclude_meeting_id) if exclude_meeting_id else None),
+            lambda: self._load_rooms_availability(start_time, end_time, exclude_meeting_id),
+        )
+
+    async def _load_rooms_availability(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_meeting_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        conflicts_by_room = await self.find_conflicts_for_rooms(
+            [room["id"] for room in ROOMS_CATALOG], start_time, end_time, exclude_meeting_id
+        )
         availability: List[Dict[str, Any]] = []
         for room in ROOMS_CATALOG:
-            conflicts = await self.find_room_conflicts(room["id"], start_time, end_time, exclude_meeting_id)
+            conflicts = conflicts_by_room[room["id"]]
             availability.append(
                 {
                     **room,
@@ -355,39 +748,76 @@ class MeetingService:
 class MetadataService:
     def __init__(self):
         self.collection: AsyncIOMotorCollection = get_metadata_collection()
+        self._cache = TTLCache(maxsize=METADATA_CACHE_SIZE)
 
     async def create_metadata(self, key: str, value: Any, metadata_type: str, description: Optional[str] = None) -> Metadata:
         """Create metadata entry"""
+        now = utcnow()
         metadata_doc = {
             "key": key,
             "value": value,
             "type": metadata_type,
             "description": description,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": now,
+            "updated_at": now
         }
         
         result = await self.collection.insert_one(metadata_doc)
         metadata_doc["_id"] = result.inserted_id
-        return Metadata(**metadata_doc)
+        self._cache.pop(key)
+        return Metadata.model_validate(metadata_doc)
+
+    @staticmethod
+    def _cacheable(key: str) -> bool:
+        return not key.startswith(NOTIFICATION_JOB_KEY_PREFIX)
 
-    async def get_metadata(self, key: str) -> Optional[Metadata]:
-        """Get metadata by key"""
+    async def get_metadata(self, key: str, ttl_ms: int = 0) -> Optional[Metadata]:
+        """Get metadata by key, served from cache when younger than ttl_ms"""
+        cacheable = self._cacheable(key)
+        cached = self._cache.get(key, ttl_ms) if cacheable else MISSING
+        if cached is not MISSING:
+            return cached
         try:
             metadata_doc = await self.collection.find_one({"key": key})
             if metadata_doc:
-                return Metadata(**metadata_doc)
+                metadata = Metadata.model_construct(**metadata_doc)
+                if cacheable:
+                    self._cache.set(key, metadata)
+                return metadata
             return None
-        except Exception:
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("get_metadata", exc)
             return None
 
+    async def get_many(self, keys: List[str], ttl_ms: int = 0) -> Dict[str, Metadata]:
+        """Get several metadata entries in one query, keyed by metadata key.
+
+        Entries cached within ttl_ms are served without querying; notification job
+        records are never cached.
+        """
+        found: Dict[str, Metadata] = {}
+        missing: List[str] = []
+        for key in keys:
+            cached = self._cache.get(key, ttl_ms) if self._cacheable(key) else MISSING
+            if cached is MISSING:
+                missing.append(key)
+            else:
+                found[key] = cached
+        if not missing:
+            return found
+
+        docs = await self.collection.find({"key": {"$in": missing}}).to_list(length=None)
+        for doc in docs:
+            metadata = Metadata.model_construct(**doc)
+            if self._cacheable(metadata.key):
+                self._cache.set(metadata.key, metadata)
+            found[metadata.key] = metadata
+        return found
+
     async def get_all_metadata(self) -> List[Metadata]:
         """Get all metadata"""
-        metadata_list = []
-        cursor = self.collection.find({})
-        async for metadata_doc in cursor:
-            metadata_list.append(Metadata(**metadata_doc))
-        return metadata_list
+        docs = await self.collection.find({}, batch_size=FULL_SCAN_BATCH_SIZE).to_list(length=None)
+        return [Metadata.model_construct(**doc) for doc in docs]
 
     async def update_metadata(self, key: str, value: Any, metadata_type: str, description: Optional[str] = None) -> Optional[Metadata]:
         """Update metadata"""
@@ -395,64 +825,132 @@ class MetadataService:
             update_dict = {
                 "value": value,
                 "type": metadata_type,
-                "updated_at": datetime.now(timezone.utc)
             }
             if description:
                 update_dict["description"] = description
             
-            result = await self.collection.update_one(
+            metadata_doc = await self.collection.find_one_and_update(
                 {"key": key},
-                {"$set": update_dict},
-                upsert=True
+                [{"$set": {
+                    **_literal_fields(update_dict),
+                    "updated_at": "$$NOW",
+                    "created_at": {"$ifNull": ["$created_at", "$$NOW"]},
+                }}],
+                upsert=True,
+                return_document=ReturnDocument.AFTER
             )
-            
-            return await self.get_metadata(key)
-        except Exception:
+            self._cache.pop(key)
+            return Metadata.model_validate(metadata_doc) if metadata_doc else None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("update_metadata", exc)
             return None
 
     async def delete_metadata(self, key: str) -> bool:
         """Delete metadata by key"""
+        self._cache.pop(key)
         try:
             result = await self.collection.delete_one({"key": key})
             return result.deleted_count > 0
-        except Exception:
+        except PyMongoError as exc:
+            _log_db_error("delete_metadata", exc)
             return False
 
+class MetadataLoader:
+    """Request-scoped loader that coalesces get_metadata calls made in the
+    same event-loop tick into a single $in query."""
+
+    def __init__(self, service: MetadataService, ttl_ms: int = METADATA_CACHE_TTL_MS):
+        self.service = service
+        self.ttl_ms = ttl_ms
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._tasks: set = set()
+
+    async def load(self, key: str) -> Optional[Metadata]:
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._dispatch)
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        return await future
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch: Dict[str, List[asyncio.Future]]) -> None:
+        try:
+            found = await self.service.get_many(list(batch), ttl_ms=self.ttl_ms)
+        except Exception as exc:
+            logger.error("Batched metadata lookup failed: %s", exc)
+            found = {}
+        for key, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(found.get(key))
+
+
 class UserService:
+    # Shared by all instances, including the one auth reuses across requests
+    _cache = TTLCache(USER_CACHE_SIZE)
+
     def __init__(self):
         self.collection: AsyncIOMotorCollection = get_users_collection()
 
+    def _evict(self, email: Optional[str], google_sub: Optional[str] = None) -> None:
+        if email:
+            self._cache.pop(email)
+        if google_sub:
+            self._cache.pop(("google_sub", google_sub))
+
     async def create_user(self, email: str, name: str, preferences: Optional[Dict[str, Any]] = None) -> User:
         """Create a new user"""
+        now = utcnow()
         user_doc = {
             "email": email,
             "name": name,
             "preferences": preferences or {},
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": now,
+            "updated_at": now
         }
         
         result = await self.collection.insert_one(user_doc)
         user_doc["_id"] = result.inserted_id
-        return User(**user_doc)
+        self._evict(email)
+        return User.model_validate(user_doc)
 
-    async def get_user(self, email: str) -> Optional[User]:
-        """Get user by email"""
+    async def get_user(self, email: str, ttl_ms: int = 0) -> Optional[User]:
+        """Get user by email, served from cache when younger than ttl_ms"""
+        cached = self._cache.get(email, ttl_ms)
+        if cached is not MISSING:
+            return cached
         try:
             user_doc = await self.collection.find_one({"email": email})
             if user_doc:
-                return User(**user_doc)
+                user = User.model_validate(user_doc)
+                self._cache.set(email, user)
+                return user
             return None
-        except Exception:
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("get_user", exc)
             return None
 
-    async def get_user_by_google_sub(self, google_sub: str) -> Optional[User]:
+    async def get_user_by_google_sub(self, google_sub: str, ttl_ms: int = 0) -> Optional[User]:
+        """Get user by Google subject id, served from cache when younger than ttl_ms"""
+        key = ("google_sub", google_sub)
+        cached = self._cache.get(key, ttl_ms)
+        if cached is not MISSING:
+            return cached
         try:
             user_doc = await self.collection.find_one({"google_sub": google_sub})
             if user_doc:
-                return User(**user_doc)
+                user = User.model_validate(user_doc)
+                self._cache.set(key, user)
+                return user
             return None
-        except Exception:
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("get_user_by_google_sub", exc)
             return None
 
     async def upsert_google_user(
@@ -464,7 +962,7 @@ class UserService:
         picture: Optional[str],
         credentials: Optional[Dict[str, Any]] = None,
     ) -> User:
-        now = datetime.now(timezone.utc)
+        now = utcnow()
         update_doc: Dict[str, Any] = {
             "email": email,
             "name": name,
@@ -483,42 +981,33 @@ class UserService:
             upsert=True,
             return_document=ReturnDocument.AFTER
         )
+        self._evict(email, google_sub)
         if result:
-            return User(**result)
+            return User.model_validate(result)
         # fallback fetch
         return await self.get_user_by_google_sub(google_sub)
 
     async def update_user_preferences(self, email: str, preferences: Dict[str, Any]) -> Optional[User]:
         """Update user preferences"""
+        self._evict(email)
         try:
-            result = await self.collection.update_one(
+            user_doc = await self.collection.find_one_and_update(
                 {"email": email},
-                {
-                    "$set": {
-                        "preferences": preferences,
-                        "updated_at": datetime.now(timezone.utc)
-                    }
-                }
+                [{"$set": {"preferences": {"$literal": preferences}, "updated_at": "$$NOW"}}],
+                return_document=ReturnDocument.AFTER,
             )
-            
-            if result.modified_count > 0:
-                return await self.get_user(email)
-            return None
-        except Exception:
+            if user_doc:
+                self._evict(email, user_doc.get("google_sub"))
+            return User.model_validate(user_doc) if user_doc else None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("update_user_preferences", exc)
             return None
 
 
 class PollService:
     def __init__(self):
         self.collection: AsyncIOMotorCollection = get_polls_collection()
-
-    @staticmethod
-    def _ensure_utc(dt: Optional[datetime]) -> Optional[datetime]:
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        self._inflight: Dict[ObjectId, "asyncio.Future[Any]"] = {}
 
     async def create_poll(
         self,
@@ -527,58 +1016,86 @@ class PollService:
         options: List[Dict[str, Any]],
         deadline: Optional[datetime] = None,
     ) -> Poll:
+        now = utcnow()
         poll_doc = {
             "meeting_id": meeting_id,
             "organizer_email": organizer_email,
             "options": [PollOption(**opt).model_dump() for opt in options],
             "votes": [],
             "status": "open",
-            "deadline": self._ensure_utc(deadline),
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "deadline": as_utc(deadline) if deadline else None,
+            "created_at": now,
+            "updated_at": now,
         }
         result = await self.collection.insert_one(poll_doc)
         poll_doc["_id"] = result.inserted_id
-        return Poll(**poll_doc)
+        return Poll.model_validate(poll_doc)
 
     async def get_poll(self, poll_id: str) -> Optional[Poll]:
         try:
-            poll_doc = await self.collection.find_one({"_id": ObjectId(poll_id)})
+            oid = _oid(poll_id)
+            poll_doc = await _coalesced(
+                self._inflight, oid, lambda: self.collection.find_one({"_id": oid})
+            )
             if poll_doc:
-                return Poll(**poll_doc)
+                return Poll.model_validate(poll_doc)
             return None
-        except Exception:
+        except InvalidId:
+            return None
+        except (PyMongoError, ValidationError) as exc:
+            _log_db_error("get_poll", exc)
             return None
 
     async def add_vote(self, poll_id: str, option_id: str, voter_email: str) -> Optional[Poll]:
+        now = utcnow()
+        vote = PollVote(option_id=option_id, voter_email=voter_email, voted_at=now).model_dump()
+        try:
+            poll_doc = await self.collection.find_one_and_update(
+                {
+                    "_id": _oid(poll_id),
+                    "status": "open",
+                    "$or": [{"deadline": None}, {"deadline": {"$gt": now}}],
+                },
+                [
+                    # Replace any existing vote from this voter with the new one
+                    {"$set": {
+                        "votes": {"$concatArrays": [
+                            {"$filter": {
+                                "input": {"$ifNull": ["$votes", []]},
+                                "as": "v",
+                                "cond": {"$ne": [{"$toLower": "$$v.voter_email"}, voter_email.lower()]},
+                            }},
+                            {"$literal": [vote]},
+                        ]},
+                    }},
+                    # Recount votes per option from the updated votes array
+                    {"$set": {
+                        "options": {"$map": {
+                            "input": "$options",
+                            "as": "o",
+                            "in": {"$mergeObjects": ["$$o", {"votes": {"$size": {"$filter": {
+                                "input": "$votes",
+                                "as": "v",
+                                "cond": {"$eq": ["$$v.option_id", "$$o.id"]},
+                            }}}}]},
+                        }},
+                        "updated_at": "$$NOW",
+                    }},
+                ],
+                return_document=ReturnDocument.AFTER,
+            )
+        except InvalidId:
+            return None
+        if poll_doc:
+            return Poll.model_validate(poll_doc)
+
+        # Nothing matched: work out why so the caller gets the right error
         poll = await self.get_poll(poll_id)
         if not poll:
             return None
         if poll.status != "open":
             raise ValueError("Poll is closed")
-        normalized_deadline = self._ensure_utc(poll.deadline)
-        if normalized_deadline and datetime.now(timezone.utc) >= normalized_deadline:
-            raise ValueError("Poll deadline has passed")
-        if normalized_deadline and poll.deadline != normalized_deadline:
-            poll.deadline = normalized_deadline
-
-        # Remove any existing vote from this voter
-        poll.votes = [vote for vote in poll.votes if vote.voter_email.lower() != voter_email.lower()]
-        poll.votes.append(PollVote(option_id=option_id, voter_email=voter_email))
-
-        # Update vote counts
-        vote_counts: Dict[str, int] = {}
-        for vote in poll.votes:
-            vote_counts[vote.option_id] = vote_counts.get(vote.option_id, 0) + 1
-        for option in poll.options:
-            option.votes = vote_counts.get(option.id, 0)
-
-        poll.updated_at = datetime.now(timezone.utc)
-        await self.collection.update_one(
-            {"_id": poll.id},
-            {"$set": poll.model_dump()}
-        )
-        return poll
+        raise ValueError("Poll deadline has passed")
 
     async def finalize_poll(self, poll_id: str, option_id: Optional[str] = None) -> Optional[Poll]:
         poll = await self.get_poll(poll_id)
@@ -588,10 +1105,12 @@ class PollService:
             return poll
 
         if option_id is None:
-            # Pick option with most votes, tie -> earliest start time
+            # Pick option with most votes, tie -> earliest start time. Count from the
+            # votes array itself rather than the denormalized options[].votes.
+            vote_counts = Counter(vote.option_id for vote in poll.votes)
             sorted_options = sorted(
                 poll.options,
-                key=lambda opt: (-opt.votes, opt.start_time)
+                key=lambda opt: (-vote_counts[opt.id], opt.start_time)
             )
             if not sorted_options:
                 raise ValueError("No options to finalize")
@@ -599,39 +1118,45 @@ class PollService:
 
         poll.status = "closed"
         poll.winning_option_id = option_id
-        poll.updated_at = datetime.now(timezone.utc)
+        poll.updated_at = utcnow()
         await self.collection.update_one(
             {"_id": poll.id},
-            {"$set": poll.model_dump()}
+            {"$set": {
+                "status": poll.status,
+                "winning_option_id": poll.winning_option_id,
+                "updated_at": poll.updated_at,
+            }}
         )
         return poll
 
     async def finalize_expired_polls(self) -> List[Poll]:
         """Automatically finalize polls whose deadlines have passed."""
-        now = datetime.now(timezone.utc)
+        now = utcnow()
         query = {
             "status": "open",
             "deadline": {"$ne": None, "$lte": now},
         }
+        docs = await self.collection.find(query, {"_id": 1}).to_list(length=None)
+        expired_ids = [str(doc["_id"]) for doc in docs]
+        semaphore = asyncio.Semaphore(FINALIZE_CONCURRENCY)
+
+        async def _finalize(poll_id: str) -> Optional[Poll]:
+            async with semaphore:
+                return await self.finalize_poll(poll_id)
+
+        results = await asyncio.gather(*(_finalize(pid) for pid in expired_ids), return_exceptions=True)
         finalized: List[Poll] = []
-        cursor = self.collection.find(query)
-        async for poll_doc in cursor:
-            poll = Poll(**poll_doc)
-            try:
-                finalized_poll = await self.finalize_poll(str(poll.id))
-                if finalized_poll:
-                    finalized.append(finalized_poll)
-            except Exception as exc:
-                logger.error("Auto finalization failed for poll %s: %s", poll.id, exc)
+        for poll_id, result in zip(expired_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Auto finalization failed for poll %s: %s", poll_id, result)
+            elif result:
+                finalized.append(result)
         return finalized
 
     async def get_polls_for_meeting(self, meeting_id: str) -> List[Poll]:
         """Get all polls for a meeting"""
-        polls: List[Poll] = []
-        cursor = self.collection.find({"meeting_id": meeting_id})
-        async for poll_doc in cursor:
-            polls.append(Poll(**poll_doc))
-        return polls
+        docs = await self.collection.find({"meeting_id": meeting_id}, batch_size=LIST_BATCH_SIZE).to_list(length=None)
+        return [_poll_from_doc(doc) for doc in docs]
 
     async def vote_on_poll(self, poll_id: str, option_id: str, voter_email: str) -> Optional[Poll]:
         """Alias for add_vote for API consistency"""
@@ -644,7 +1169,10 @@ class PollService:
     async def delete_poll(self, poll_id: str) -> bool:
         """Delete a poll"""
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(poll_id)})
+            result = await self.collection.delete_one({"_id": _oid(poll_id)})
             return result.deleted_count > 0
-        except Exception:
+        except InvalidId:
+            return False
+        except PyMongoError as exc:
+            _log_db_error("delete_poll", exc)
             return False
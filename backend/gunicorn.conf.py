@@ -0,0 +1,10 @@
+import multiprocessing
+import os
+
+# Production server: gunicorn supervising uvicorn workers, one per core by default.
+# The lifespan hook runs in every worker (each gets its own MongoDB client); only
+# one worker runs the background jobs, see _acquire_background_jobs_lock in main.py.
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.Worker"
+accesslog = None
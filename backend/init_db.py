@@ -7,18 +7,26 @@ Creates sample metadata and initializes the database
 import asyncio
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.database import MongoDB
-from app.services import MetadataService
+from pymongo.errors import BulkWriteError
+
+from app.database import MongoDB, get_metadata_collection
+from app.services import MeetingService, MetadataService
 
 async def initialize_database():
     """Initialize the database with sample metadata"""
     try:
         await MongoDB.connect_to_mongo()
         print("✅ Connected to MongoDB")
+
+        await MongoDB.ensure_indexes()
+        print("✅ Ensured indexes")
+
+        backfilled = await MeetingService().backfill_emails_all()
+        print(f"✅ Backfilled emails_all on {backfilled} meetings")
         
         metadata_service = MetadataService()
         
@@ -89,19 +97,26 @@ async def initialize_database():
             }
         ]
         
-        created_count = 0
-        for metadata_item in sample_metadata:
-            try:
-                await metadata_service.create_metadata(
-                    key=metadata_item["key"],
-                    value=metadata_item["value"],
-                    metadata_type=metadata_item["type"],
-                    description=metadata_item["description"]
-                )
-                created_count += 1
-                print(f"✅ Created metadata: {metadata_item['key']}")
-            except Exception as e:
-                print(f"⚠️  Failed to create metadata {metadata_item['key']}: {e}")
+        now = datetime.now(timezone.utc)
+        docs = [
+            {
+                "key": metadata_item["key"],
+                "value": metadata_item["value"],
+                "type": metadata_item["type"],
+                "description": metadata_item["description"],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for metadata_item in sample_metadata
+        ]
+        try:
+            result = await get_metadata_collection().insert_many(docs, ordered=False)
+            created_count = len(result.inserted_ids)
+        except BulkWriteError as e:
+            # Existing keys hit the unique index; the rest are still inserted
+            created_count = e.details.get("nInserted", 0)
+            for error in e.details.get("writeErrors", []):
+                print(f"⚠️  Failed to create metadata {docs[error['index']]['key']}: {error.get('errmsg')}")
         
         print(f"\n🎉 Database initialization complete!")
         print(f"📊 Created {created_count} metadata entries")
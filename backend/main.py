@@ -1,37 +1,60 @@
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.responses import RedirectResponse
 from contextlib import asynccontextmanager
 import asyncio
+import orjson
 import uvicorn
 from datetime import datetime
 import os
 import logging
-from typing import List, Optional, Dict, Any, Annotated
-from pydantic import BaseModel, Field
+import tempfile
+import time
+from typing import IO, List, Literal, Optional, Dict, Any, Annotated, AsyncIterator, Awaitable, Callable, Tuple, Union
+from pydantic import BaseModel, Field, TypeAdapter
 import uuid
 import hashlib
+from functools import lru_cache, partial
 import hmac
 from urllib.parse import quote
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows dev machines
+    fcntl = None
+
+from app.logging_config import setup_logging
+
+# Before the other app imports, some of which log while initializing
+setup_logging()
+
+from app.cache import RequestCacheMiddleware
 from app.database import MongoDB
-from app.models import Meeting, MeetingCreate, MeetingUpdate, Metadata, Room, RoomAvailability, User, Poll
-from app.services import MeetingService, MetadataService, UserService, PollService
+from app.models import Meeting, MeetingCreate, MeetingSummary, MeetingUpdate, Metadata, Room, RoomAvailability, User, Poll, Participant, as_utc
+from app.services import (
+    MeetingService,
+    MetadataService,
+    MetadataLoader,
+    PollService,
+    GOOGLE_SYNC_CLAIM_KEY,
+    MEETING_CACHE_TTL_MS,
+    NOTIFICATION_JOB_KEY_PREFIX,
+    USER_CACHE_TTL_MS,
+)
 from app.google_calendar import (
     generate_auth_url,
     exchange_code_for_tokens,
     create_event_with_meet,
     create_calendar_event,
-    update_event_attendees,
+    update_events_attendees,
     update_event,
     delete_event,
 )
 import anyio
 from app.notification_service import notification_service
 from app.email_reply_listener import EmailReplyListener
-from app.auth import create_access_token, get_current_user_token, get_optional_user_token, security
+from app.auth import create_access_token, get_current_user_token, get_optional_user_token, get_user_service, security
 from app.ai_service import ai_service
 from google.oauth2 import id_token as google_id_token
 from google.auth.transport import requests as google_requests
@@ -43,15 +66,9 @@ from zoneinfo import ZoneInfo
 from jose import jwt, JWTError
 
 
-def _ensure_tz(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
-
-
 def _parse_busy_entry(entry: Dict[str, str]) -> tuple[datetime, datetime]:
-    start = _ensure_tz(date_parser.isoparse(entry["start"]))
-    end = _ensure_tz(date_parser.isoparse(entry["end"]))
+    start = as_utc(date_parser.isoparse(entry["start"]))
+    end = as_utc(date_parser.isoparse(entry["end"]))
     return start, end
 
 
@@ -110,6 +127,18 @@ POLL_TOKEN_SECRET_BYTES = POLL_TOKEN_SECRET.encode("utf-8")
 POLL_TOKEN_ALGORITHM = "HS256"
 POLL_TOKEN_TTL_HOURS = int(os.getenv("POLL_TOKEN_TTL_HOURS", str(24 * 7)))
 
+DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "UTC")
+
+FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
+MIN_MEETING_SECONDS = 5 * 60
+
+# Serializer for the summary list, built once instead of per response
+MEETING_SUMMARY_LIST_ADAPTER = TypeAdapter(List[MeetingSummary])
+# Meetings per chunk when streaming the full list
+STREAM_CHUNK_ITEMS = 100
+# Body for the common stale-meeting-id miss, encoded once
+MEETING_NOT_FOUND_BODY = orjson.dumps({"detail": "Meeting not found"})
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,7 +146,7 @@ def _poll_token_expiration(deadline: Optional[datetime]) -> datetime:
     default_exp = datetime.now(timezone.utc) + timedelta(hours=POLL_TOKEN_TTL_HOURS)
     if not deadline:
         return default_exp
-    deadline_utc = _ensure_tz(deadline)
+    deadline_utc = as_utc(deadline)
     return min(default_exp, deadline_utc)
 
 
@@ -225,12 +254,15 @@ async def _apply_poll_outcome(poll: Poll) -> Optional[Meeting]:
             )
             updated_meeting = await meeting_service.update_meeting(poll.meeting_id, update)
             meeting = updated_meeting or meeting
-            meta = dict(meeting.metadata or {})
-            if meta.pop("poll_pending", None):
-                updated_meta = await meeting_service.update_meeting_metadata(poll.meeting_id, meta)
+            if (meeting.metadata or {}).get("poll_pending"):
+                updated_meta = await meeting_service.set_meeting_metadata_fields(
+                    poll.meeting_id, {}, remove=["poll_pending"]
+                )
                 meeting = updated_meta or meeting
-            for participant in meeting.participants:
-                await notification_service.send_poll_finalized(meeting, participant, winning_option)
+            await notification_service.send_to_participants(
+                meeting.participants,
+                lambda participant: notification_service.send_poll_finalized(meeting, participant, winning_option),
+            )
     return meeting
 
 
@@ -274,6 +306,41 @@ class PollAutoFinalizer:
             await asyncio.sleep(self.interval_seconds)
 
 
+class MeetingStatusSweeper:
+    def __init__(self, meeting_service: MeetingService, interval_seconds: int = 60):
+        self.meeting_service = meeting_service
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._task:
+            return
+        loop = asyncio.get_running_loop()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self):
+        if not self._task:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                updated = await self.meeting_service.sweep_statuses()
+                if updated:
+                    logger.info("Updated status of %s meetings", updated)
+            except asyncio.CancelledError:
+                break
+            except Exception as exc:
+                logger.error("Meeting status sweeper encountered an error: %s", exc)
+            await asyncio.sleep(self.interval_seconds)
+
+
 def _get_zone(tz_name: Optional[str]) -> ZoneInfo:
     try:
         return ZoneInfo(tz_name) if tz_name else ZoneInfo("UTC")
@@ -351,6 +418,10 @@ class UpdateNotificationRequest(BaseModel):
 class CancellationNotificationRequest(BaseModel):
     cancellation_reason: str
 
+class NotifyRequest(BaseModel):
+    changes_description: Optional[str] = None
+    cancellation_reason: Optional[str] = None
+
 class AddParticipantsRequest(BaseModel):
     emails: List[str] = Field(default_factory=list)
 
@@ -389,6 +460,10 @@ class RoomsAvailabilityResponse(BaseModel):
     rooms: List[RoomAvailability]
 
 
+class MeetingCreateResponse(BaseModel):
+    id: str
+
+
 CurrentUser = Annotated[User, Depends(get_current_user_token)]
 OptionalCurrentUser = Annotated[Optional[User], Depends(get_optional_user_token)]
 
@@ -404,10 +479,24 @@ metadata_service = None
 user_service = None
 poll_service = None
 poll_auto_finalizer: Optional["PollAutoFinalizer"] = None
+meeting_status_sweeper: Optional["MeetingStatusSweeper"] = None
+
+
+def get_metadata_loader() -> MetadataLoader:
+    """One loader per request so concurrent lookups share a single query."""
+    return MetadataLoader(metadata_service)
+
+
+MetadataLoaderDep = Annotated[MetadataLoader, Depends(get_metadata_loader)]
+
+@lru_cache(maxsize=4096)
+def _reply_key_prefix(meeting_id: str, from_email: str) -> str:
+    return f"reply:{meeting_id}:{from_email}:"
+
 
 async def process_email_reply(meeting_id: str, from_email: str, action: str, payload: str | None):
     # Basic placeholder actions: record metadata; real logic can update meetings
-    metadata_key = f"reply:{meeting_id}:{from_email}:{datetime.now(timezone.utc).isoformat()}"
+    metadata_key = f"{_reply_key_prefix(meeting_id, from_email)}{time.time_ns()}"
     await metadata_service.create_metadata(
         key=metadata_key,
         value={"action": action, "payload": payload},
@@ -418,64 +507,121 @@ async def process_email_reply(meeting_id: str, from_email: str, action: str, pay
 
 reply_listener: EmailReplyListener | None = None
 GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
+# Reused for ID token verification so Google's cert fetches keep one pooled session
+GOOGLE_AUTH_REQUEST = google_requests.Request()
+
+
+def _acquire_background_jobs_lock() -> Optional[IO[str]]:
+    """Elect one worker process to run the background jobs.
+
+    Under gunicorn every worker runs the lifespan hook; whichever worker takes this
+    file lock runs the reply listener, poll finalizer and status sweeper. Returns the
+    open lock file (hold it until shutdown) or None if another worker has it.
+    """
+    if fcntl is None:
+        return open(os.devnull, "w")
+    path = os.getenv(
+        "BACKGROUND_JOBS_LOCK_FILE",
+        os.path.join(tempfile.gettempdir(), "meeting-scheduler-jobs.lock"),
+    )
+    handle = open(path, "w")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        handle.close()
+        return None
+    return handle
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print("Starting Meeting Scheduler Backend...")
+    logger.info("Starting Meeting Scheduler Backend...")
+    # Blocking Google Calendar calls run on AnyIO's thread pool; cap it.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = int(
+        os.getenv("THREADPOOL_SIZE", "16")
+    )
     await MongoDB.connect_to_mongo()
+    await MongoDB.ensure_indexes()
     
     # Initialize services after database connection
-    global meeting_service, metadata_service, user_service, poll_service, poll_auto_finalizer
+    global meeting_service, metadata_service, user_service, poll_service, poll_auto_finalizer, meeting_status_sweeper
     meeting_service = MeetingService()
     metadata_service = MetadataService()
-    user_service = UserService()
+    user_service = get_user_service()
     poll_service = PollService()
+    # Also reachable from the app object for code that embeds or tests it
+    app.state.meeting_service = meeting_service
+    app.state.metadata_service = metadata_service
+    app.state.user_service = user_service
+    app.state.poll_service = poll_service
+    backfilled = await meeting_service.backfill_emails_all()
+    if backfilled:
+        logger.info("Backfilled emails_all on %s meetings", backfilled)
     global reply_listener
-    reply_listener = EmailReplyListener(process_email_reply)
-    await reply_listener.start()
-    poll_auto_finalizer = PollAutoFinalizer(
-        poll_service,
-        interval_seconds=int(os.getenv("POLL_FINALIZER_INTERVAL_SECONDS", "60")),
-    )
-    await poll_auto_finalizer.start()
+    jobs_lock = _acquire_background_jobs_lock()
+    if jobs_lock:
+        reply_listener = EmailReplyListener(process_email_reply)
+        await reply_listener.start()
+        app.state.reply_listener = reply_listener
+        poll_auto_finalizer = PollAutoFinalizer(
+            poll_service,
+            interval_seconds=int(os.getenv("POLL_FINALIZER_INTERVAL_SECONDS", "60")),
+        )
+        await poll_auto_finalizer.start()
+        meeting_status_sweeper = MeetingStatusSweeper(
+            meeting_service,
+            interval_seconds=int(os.getenv("MEETING_STATUS_SWEEP_INTERVAL_SECONDS", "60")),
+        )
+        await meeting_status_sweeper.start()
     
     yield
-    print("Shutting down Meeting Scheduler Backend...")
+    logger.info("Shutting down Meeting Scheduler Backend...")
     if reply_listener:
         await reply_listener.stop()
     if poll_auto_finalizer:
         await poll_auto_finalizer.stop()
+    if meeting_status_sweeper:
+        await meeting_status_sweeper.stop()
+    if jobs_lock:
+        jobs_lock.close()
+    await ai_service.aclose()
+    await asyncio.to_thread(notification_service.close)
     await MongoDB.close_mongo_connection()
 
 app = FastAPI(
     title="Meeting Scheduler API",
     description="AI-powered meeting scheduling API",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Temporarily disable authentication for development
 # security = HTTPBearer()
 
+app.add_middleware(RequestCacheMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[os.getenv("FRONTEND_URL", "http://localhost:3000")],
+    allow_origins=[FRONTEND_URL],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["*"]
-)
+_health_stamp: tuple[int, str] = (0, "")
+
 
 @app.get("/health")
 async def health_check():
+    # Load balancers probe several times a second; reformat the timestamp once per second
+    global _health_stamp
+    second = int(time.time())
+    if _health_stamp[0] != second:
+        _health_stamp = (second, datetime.now(timezone.utc).isoformat())
     return {
         "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _health_stamp[1],
         "service": "meeting-scheduler-backend"
     }
 
@@ -528,8 +674,8 @@ async def get_calendar_events(
         events = await anyio.to_thread.run_sync(
             calendar_list_events,
             creds,
-            _ensure_tz(time_min),
-            _ensure_tz(time_max),
+            as_utc(time_min),
+            as_utc(time_max),
         )
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to load events: {exc}") from exc
@@ -577,7 +723,7 @@ async def google_auth_callback(code: str, state: Optional[str] = None):
     try:
         id_info = google_id_token.verify_oauth2_token(
             id_token_jwt,
-            google_requests.Request(),
+            GOOGLE_AUTH_REQUEST,
             GOOGLE_CLIENT_ID
         )
     except ValueError as exc:
@@ -611,27 +757,208 @@ async def google_auth_callback(code: str, state: Optional[str] = None):
         "user": user,
     }
 
-@app.get("/api/meetings", response_model=List[Meeting])
-async def get_meetings(current_user: CurrentUser):
-    """Get all meetings for the current user"""
-    return await meeting_service.get_all_meetings(current_user.email)
+# Per-meeting locks (with holder counts) so background syncs of one meeting run in turn
+_google_sync_locks: Dict[str, List[Any]] = {}
 
-@app.post("/api/meetings", response_model=Meeting)
-async def create_meeting(meeting_data: MeetingCreate, current_user: CurrentUser):
-    """Create a new meeting"""
-    # Validate that end time is after start time and start is in the future (unless poll pending)
-    now = datetime.now(timezone.utc)
-    start_time = _ensure_tz(meeting_data.start_time)
-    end_time = _ensure_tz(meeting_data.end_time)
-    meeting_data.start_time = start_time
-    meeting_data.end_time = end_time
+
+async def _sync_google_event(meeting: Meeting, creds: Dict[str, Any]) -> None:
+    """Create or update the organizer's Google Calendar event for a meeting.
+
+    Runs as a background task; failures are logged and never reach the client. Syncs
+    for the same meeting are serialized in this process and re-read the meeting; across
+    workers, only the sync holding the claim_google_event claim creates the event.
+    """
+    meeting_id = str(meeting.id)
+    entry = _google_sync_locks.get(meeting_id)
+    if entry is None:
+        entry = _google_sync_locks[meeting_id] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            current = await meeting_service.get_meeting(meeting_id)
+            if current is not None:
+                await _push_google_event(current, creds)
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _google_sync_locks[meeting_id]
+
+
+def _google_event_fields(meeting: Meeting) -> tuple:
+    """The meeting fields mirrored onto its Google Calendar event"""
+    return (
+        meeting.title,
+        meeting.description,
+        meeting.start_time,
+        meeting.end_time,
+        [p.email for p in meeting.participants],
+    )
+
+
+async def _push_google_event(meeting: Meeting, creds: Dict[str, Any]) -> None:
+    meeting_id = str(meeting.id)
+    try:
+        event_timezone = DEFAULT_TIMEZONE
+        google_event_id = (meeting.metadata or {}).get("google_event_id")
+        location_type = (meeting.metadata or {}).get("location_type", "online")
+        location_text = (meeting.metadata or {}).get("room_location") or (meeting.metadata or {}).get("room_name")
+        attendees = [p.email for p in meeting.participants]
+
+        if google_event_id:
+            update_fn = partial(
+                update_event,
+                creds,
+                event_id=google_event_id,
+                title=meeting.title,
+                description=meeting.description,
+                start_time=meeting.start_time,
+                end_time=meeting.end_time,
+                timezone=event_timezone,
+                attendees=attendees,
+            )
+            await anyio.to_thread.run_sync(update_fn)
+            return
+
+        if location_type == "online":
+            create_fn = partial(
+                create_event_with_meet,
+                creds,
+                title=meeting.title,
+                description=meeting.description,
+                start_time=meeting.start_time,
+                end_time=meeting.end_time,
+                attendees=attendees,
+                timezone=event_timezone,
+            )
+        else:
+            create_fn = partial(
+                create_calendar_event,
+                creds,
+                title=meeting.title,
+                description=meeting.description,
+                start_time=meeting.start_time,
+                end_time=meeting.end_time,
+                attendees=attendees,
+                timezone=event_timezone,
+                location=location_text,
+            )
+        # Another sync (maybe on another worker) is creating the event, or it exists now
+        if not await meeting_service.claim_google_event(meeting_id):
+            return
+        try:
+            created = await anyio.to_thread.run_sync(create_fn)
+        except Exception:
+            await meeting_service.set_meeting_metadata_fields(meeting_id, {}, remove=[GOOGLE_SYNC_CLAIM_KEY])
+            raise
+        # Update meeting metadata with Google event info
+        meta_fields: Dict[str, Any] = {}
+        if location_type == "online":
+            meta_fields["meeting_platform"] = "google_meet"
+            if created.meet_url:
+                meta_fields["meeting_url"] = created.meet_url
+        if created.event_id:
+            meta_fields["google_event_id"] = created.event_id
+        if created.html_link:
+            meta_fields["google_event_link"] = created.html_link
+        stored = await meeting_service.set_meeting_metadata_fields(
+            meeting_id, meta_fields, remove=[GOOGLE_SYNC_CLAIM_KEY]
+        )
+        if stored is None:
+            # Deleted while the event was being created; don't leave it (and its invites) behind
+            if created.event_id:
+                await anyio.to_thread.run_sync(partial(delete_event, creds, event_id=created.event_id))
+            return
+        # Edits that lost the claim to this sync skipped pushing; send them now
+        if created.event_id and _google_event_fields(stored) != _google_event_fields(meeting):
+            await anyio.to_thread.run_sync(partial(
+                update_event,
+                creds,
+                event_id=created.event_id,
+                title=stored.title,
+                description=stored.description,
+                start_time=stored.start_time,
+                end_time=stored.end_time,
+                timezone=event_timezone,
+                attendees=[p.email for p in stored.participants],
+            ))
+    except Exception as e:
+        logger.warning("Google Calendar sync failed for meeting %s: %s", meeting.id, e)
+
+
+async def _sync_google_attendees(creds: Dict[str, Any], attendees_by_event: Dict[str, List[str]]) -> None:
+    """Push participant lists to Google Calendar events in one batch (background task)."""
+    try:
+        update_fn = partial(update_events_attendees, creds, attendees_by_event, send_updates="all")
+        results = await anyio.to_thread.run_sync(update_fn)
+    except Exception as e:
+        logger.warning("Google event attendee update failed: %s", e)
+        return
+    for event_id, error in results.items():
+        if error is not None:
+            logger.warning("Google event attendee update failed for %s: %s", event_id, error)
+
+
+def _json_response(model: BaseModel, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Serialize a trusted model directly; FastAPI skips re-validating a returned Response"""
+    return Response(model.model_dump_json(by_alias=True), media_type="application/json", headers=headers)
+
+
+def _meeting_not_found() -> Response:
+    """404 returned directly so missed lookups skip the exception handler path"""
+    # Fresh Response per call: middleware such as CORS appends to its header list
+    return Response(MEETING_NOT_FOUND_BODY, status_code=404, media_type="application/json")
+
+
+async def _stream_json_array(first: Optional[BaseModel], items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    """Encode first and then items as one JSON array, flushing every STREAM_CHUNK_ITEMS items"""
+    yield b"["
+    if first is None:
+        yield b"]"
+        return
+    sent = 0
+    chunk: List[bytes] = [first.model_dump_json(by_alias=True).encode()]
+    async for item in items:
+        chunk.append(item.model_dump_json(by_alias=True).encode())
+        if len(chunk) >= STREAM_CHUNK_ITEMS:
+            yield (b"," if sent else b"") + b",".join(chunk)
+            sent += len(chunk)
+            chunk = []
+    if chunk:
+        yield (b"," if sent else b"") + b",".join(chunk)
+    yield b"]"
+
+
+@app.get("/api/meetings", response_model=Union[List[Meeting], List[MeetingSummary]])
+async def get_meetings(current_user: CurrentUser, summary: bool = False):
+    """Get all meetings for the current user; summary=true returns list-view fields only"""
+    if summary:
+        summaries = await meeting_service.get_all_meetings_summary(current_user.email)
+        return Response(MEETING_SUMMARY_LIST_ADAPTER.dump_json(summaries, by_alias=True), media_type="application/json")
+    meetings = meeting_service.iter_meetings(current_user.email)
+    # Fetch the first cursor batch before the 200 goes out, so query failures still
+    # reach the error handler; a later failure aborts the chunked body mid-stream
+    first = await anext(meetings, None)
+    return StreamingResponse(_stream_json_array(first, meetings), media_type="application/json")
+
+@app.post("/api/meetings", response_model=Union[Meeting, MeetingCreateResponse])
+async def create_meeting(
+    meeting_data: MeetingCreate,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+    response: Response,
+    prefer: Optional[str] = Header(None),
+):
+    """Create a new meeting; send `Prefer: return=minimal` to get back only its id"""
+    # Validate that end time is after start time and start is in the future (unless poll pending).
+    # MeetingCreate has already normalized both times to UTC epoch seconds.
+    start_ts = meeting_data.start_ts
+    end_ts = meeting_data.end_ts
     poll_pending = bool((meeting_data.metadata or {}).get("poll_pending"))
-    if not poll_pending and start_time <= now:
+    if not poll_pending and start_ts <= time.time():
         raise HTTPException(status_code=400, detail="Start time must be in the future.")
-    if end_time <= start_time:
+    if end_ts <= start_ts:
         raise HTTPException(status_code=400, detail="End time must be after start time. Please choose an end time later than the start.")
-    from datetime import timedelta
-    if (end_time - start_time) < timedelta(minutes=5):
+    if end_ts - start_ts < MIN_MEETING_SECONDS:
         raise HTTPException(status_code=400, detail="Meeting duration must be at least 5 minutes. Extend the end time or move the start time earlier.")
 
     # Create meeting in DB first
@@ -644,65 +971,23 @@ async def create_meeting(meeting_data: MeetingCreate, current_user: CurrentUser)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    # Attempt to create calendar events if user connected Google
-    try:
-        user = current_user
-        prefs = user.preferences if user else {}
-        creds = prefs.get("google_credentials")
-        location_type = (meeting.metadata or {}).get("location_type", "online")
-        if creds:
-            attendees = [p.email for p in meeting.participants]
-            event_timezone = os.getenv("DEFAULT_TIMEZONE", "UTC")
-            location_text = (meeting.metadata or {}).get("room_location") or (meeting.metadata or {}).get("room_name")
-            from functools import partial
-            if location_type == "online":
-                create_fn = partial(
-                    create_event_with_meet,
-                    creds,
-                    title=meeting.title,
-                    description=meeting.description,
-                    start_time=meeting.start_time,
-                    end_time=meeting.end_time,
-                    attendees=attendees,
-                    timezone=event_timezone,
-                )
-            else:
-                create_fn = partial(
-                    create_calendar_event,
-                    creds,
-                    title=meeting.title,
-                    description=meeting.description,
-                    start_time=meeting.start_time,
-                    end_time=meeting.end_time,
-                    attendees=attendees,
-                    timezone=event_timezone,
-                    location=location_text,
-                )
-            created = await anyio.to_thread.run_sync(create_fn)
-            # Update meeting metadata with Google event info
-            new_meta = dict(meeting.metadata or {})
-            if location_type == "online":
-                new_meta["meeting_platform"] = "google_meet"
-                if created.meet_url:
-                    new_meta["meeting_url"] = created.meet_url
-            if created.event_id:
-                new_meta["google_event_id"] = created.event_id
-            if created.html_link:
-                new_meta["google_event_link"] = created.html_link
-            meeting = await meeting_service.update_meeting_metadata(str(meeting.id), new_meta) or meeting
-    except Exception as e:
-        # Log and continue without failing meeting creation
-        print(f"Google Calendar integration failed: {e}")
+    # Create the calendar event after responding if the user connected Google
+    creds = (current_user.preferences or {}).get("google_credentials")
+    if creds:
+        background.add_task(_sync_google_event, meeting, creds)
 
-    return meeting
+    if prefer and "return=minimal" in prefer:
+        response.headers["Preference-Applied"] = "return=minimal"
+        return MeetingCreateResponse(id=str(meeting.id))
+    return _json_response(meeting)
 
 
 @app.post("/api/availability/suggest")
 async def suggest_availability(request: AvailabilityRequest, current_user: CurrentUser):
     if not request.participants:
         raise HTTPException(status_code=400, detail="Participants are required")
-    window_start = _ensure_tz(request.window_start)
-    window_end = _ensure_tz(request.window_end)
+    window_start = as_utc(request.window_start)
+    window_end = as_utc(request.window_end)
     if window_end <= window_start:
         raise HTTPException(status_code=400, detail="window_end must be after window_start")
     duration = timedelta(minutes=request.duration_minutes)
@@ -711,14 +996,14 @@ async def suggest_availability(request: AvailabilityRequest, current_user: Curre
     increment = timedelta(minutes=request.slot_increment_minutes)
     participants = list(dict.fromkeys([*(request.participants or []), current_user.email]))
 
-    client_timezone = request.client_timezone or os.getenv("DEFAULT_TIMEZONE", "UTC")
+    client_timezone = request.client_timezone or DEFAULT_TIMEZONE
 
     missing: List[str] = []
     missing_details: Dict[str, str] = {}
     busy: List[tuple[datetime, datetime]] = []
 
     for email in participants:
-        user = await user_service.get_user(email)
+        user = await user_service.get_user(email, ttl_ms=USER_CACHE_TTL_MS)
         creds = (user.preferences or {}).get("google_credentials") if user else None
         if not creds:
             missing.append(email)
@@ -841,11 +1126,9 @@ async def conversational_schedule(
         
         # Calculate end_time if not provided
         if not end_time and duration_minutes:
-            from datetime import timedelta
             end_time = start_time + timedelta(minutes=duration_minutes)
         elif not end_time:
             # Default to 30 minutes if no duration specified
-            from datetime import timedelta
             end_time = start_time + timedelta(minutes=30)
         
         # Validate times
@@ -915,47 +1198,61 @@ async def conversational_schedule(
         )
 
 
+def _meeting_etag(meeting: Meeting) -> str:
+    # status is derived from the clock, so it can change without updated_at moving
+    return f'W/"{meeting.id}-{meeting.updated_at.timestamp()}-{meeting.status}"'
+
+
 @app.get("/api/meetings/{meeting_id}", response_model=Meeting)
-async def get_meeting(meeting_id: str, current_user: CurrentUser):
+async def get_meeting(meeting_id: str, current_user: CurrentUser, request: Request):
     """Get a specific meeting by ID"""
-    meeting = await meeting_service.get_meeting(meeting_id)
+    meeting = await meeting_service.get_meeting(meeting_id, ttl_ms=MEETING_CACHE_TTL_MS)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(meeting, current_user)
 
-    if meeting.status == "completed" or meeting.end_time <= datetime.now(timezone.utc):
+    if meeting.status == "completed" or meeting.end_time.timestamp() <= time.time():
         raise HTTPException(status_code=400, detail="Cannot generate event for a completed meeting.")
-    return meeting
+
+    etag = _meeting_etag(meeting)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return _json_response(meeting, headers={"ETag": etag})
 
 @app.put("/api/meetings/{meeting_id}", response_model=Meeting)
-async def update_meeting(meeting_id: str, meeting_update: MeetingUpdate, current_user: CurrentUser):
+async def update_meeting(
+    meeting_id: str,
+    meeting_update: MeetingUpdate,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+):
     """Update a meeting"""
     # Validate new times against current meeting to ensure min duration and proper ordering
     current_meeting = await meeting_service.get_meeting(meeting_id)
     if not current_meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(current_meeting, current_user)
 
-    if current_meeting.status == "completed" or current_meeting.end_time <= datetime.now(timezone.utc):
+    if current_meeting.status == "completed" or current_meeting.end_time.timestamp() <= time.time():
         raise HTTPException(status_code=400, detail="Completed meetings cannot be modified.")
 
-    normalized_start = _ensure_tz(meeting_update.start_time) if meeting_update.start_time else None
-    normalized_end = _ensure_tz(meeting_update.end_time) if meeting_update.end_time else None
+    normalized_start = as_utc(meeting_update.start_time) if meeting_update.start_time else None
+    normalized_end = as_utc(meeting_update.end_time) if meeting_update.end_time else None
 
     proposed_start = normalized_start or current_meeting.start_time
     proposed_end = normalized_end or current_meeting.end_time
 
-    if normalized_start is not None or normalized_end is not None:
-        meeting_update = meeting_update.model_copy(
-            update={
-                "start_time": normalized_start,
-                "end_time": normalized_end,
-            }
-        )
+    # Only the times the client sent; a None here would be stored over the existing time
+    normalized_times = {
+        field: value
+        for field, value in (("start_time", normalized_start), ("end_time", normalized_end))
+        if value is not None
+    }
+    if normalized_times:
+        meeting_update = meeting_update.model_copy(update=normalized_times)
 
     if proposed_end <= proposed_start:
         raise HTTPException(status_code=400, detail="End time must be after start time. Please choose an end time later than the start.")
-    from datetime import timedelta
     if (proposed_end - proposed_start) < timedelta(minutes=5):
         raise HTTPException(status_code=400, detail="Meeting duration must be at least 5 minutes. Extend the end time or move the start time earlier.")
 
@@ -972,88 +1269,32 @@ async def update_meeting(meeting_id: str, meeting_update: MeetingUpdate, current
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
 
-    # Sync changes to Google Calendar if event exists or create one if needed for online meetings
-    try:
-        user = current_user
-        prefs = user.preferences if user else {}
-        creds = prefs.get("google_credentials")
-        if creds:
-            event_timezone = os.getenv("DEFAULT_TIMEZONE", "UTC")
-            google_event_id = (meeting.metadata or {}).get("google_event_id")
-            location_type = (meeting.metadata or {}).get("location_type", "online")
-            location_text = (meeting.metadata or {}).get("room_location") or (meeting.metadata or {}).get("room_name")
-            attendees = [p.email for p in meeting.participants]
-
-            if not google_event_id:
-                from functools import partial
-                if location_type == "online":
-                    create_fn = partial(
-                        create_event_with_meet,
-                        creds,
-                        title=meeting.title,
-                        description=meeting.description,
-                        start_time=meeting.start_time,
-                        end_time=meeting.end_time,
-                        attendees=attendees,
-                        timezone=event_timezone,
-                    )
-                else:
-                    create_fn = partial(
-                        create_calendar_event,
-                        creds,
-                        title=meeting.title,
-                        description=meeting.description,
-                        start_time=meeting.start_time,
-                        end_time=meeting.end_time,
-                        attendees=attendees,
-                        timezone=event_timezone,
-                        location=location_text,
-                    )
-                created = await anyio.to_thread.run_sync(create_fn)
-                meta = dict(meeting.metadata or {})
-                if location_type == "online":
-                    meta["meeting_platform"] = "google_meet"
-                    if created.meet_url:
-                        meta["meeting_url"] = created.meet_url
-                if created.event_id:
-                    meta["google_event_id"] = created.event_id
-                if created.html_link:
-                    meta["google_event_link"] = created.html_link
-                meeting = await meeting_service.update_meeting_metadata(str(meeting.id), meta) or meeting
-            elif google_event_id:
-                from functools import partial
-                update_fn = partial(
-                    update_event,
-                    creds,
-                    event_id=google_event_id,
-                    title=meeting.title,
-                    description=meeting.description,
-                    start_time=meeting.start_time,
-                    end_time=meeting.end_time,
-                    timezone=event_timezone,
-                    attendees=attendees,
-                )
-                await anyio.to_thread.run_sync(update_fn)
-    except Exception as e:
-        print(f"Google Calendar sync on update failed: {e}")
+    # Sync changes to Google Calendar after responding if the user connected Google
+    creds = (current_user.preferences or {}).get("google_credentials")
+    if creds:
+        background.add_task(_sync_google_event, meeting, creds)
 
-    return meeting
+    return _json_response(meeting)
 
 @app.delete("/api/meetings/{meeting_id}")
 async def delete_meeting(meeting_id: str, current_user: CurrentUser):
     """Delete a meeting"""
     meeting = await meeting_service.get_meeting(meeting_id)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(meeting, current_user)
-    google_event_id = (meeting.metadata or {}).get("google_event_id")
+    # Read the event id from the deleted document itself: a background sync may have
+    # stored it after the lookup above. A sync still creating the event will find the
+    # meeting gone and delete the event it made.
+    deleted = await meeting_service.delete_meeting(meeting_id)
+    if not deleted:
+        return _meeting_not_found()
+    google_event_id = (deleted.get("metadata") or {}).get("google_event_id")
     creds = (current_user.preferences or {}).get("google_credentials")
     if google_event_id and creds:
         try:
-            from functools import partial
-
             delete_fn = partial(
                 delete_event,
                 creds,
@@ -1061,114 +1302,159 @@ async def delete_meeting(meeting_id: str, current_user: CurrentUser):
             )
             await anyio.to_thread.run_sync(delete_fn)
         except Exception as exc:
-            print(f"Failed to delete Google Calendar event {google_event_id}: {exc}")
-    success = await meeting_service.delete_meeting(meeting_id)
-    if not success:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+            logger.warning("Failed to delete Google Calendar event %s: %s", google_event_id, exc)
     return {"message": "Meeting deleted successfully"}
 
-@app.post("/api/meetings/{meeting_id}/send-invitation")
-async def send_invitation(meeting_id: str, current_user: CurrentUser):
-    """Send invitation for a meeting to all participants"""
-    meeting = await meeting_service.get_meeting(meeting_id)
+NotificationKind = Literal["invitation", "reminder", "update", "cancellation"]
+
+# kind -> (bulk sender, label for the summary message)
+NOTIFY_DISPATCH: Dict[str, Tuple[Callable[[Meeting, NotifyRequest], Awaitable[Dict[str, bool]]], str]] = {
+    "invitation": (
+        lambda meeting, body: notification_service.send_bulk_invitations(meeting),
+        "Invitations",
+    ),
+    "reminder": (
+        lambda meeting, body: notification_service.send_bulk_reminders(meeting, hours_before=1),
+        "Reminders",
+    ),
+    "update": (
+        lambda meeting, body: notification_service.send_bulk_updates(meeting, body.changes_description),
+        "Update notifications",
+    ),
+    "cancellation": (
+        lambda meeting, body: notification_service.send_bulk_cancellations(meeting, body.cancellation_reason),
+        "Cancellation notifications",
+    ),
+}
+
+
+# Kinds sent after the response; their outcome is recorded as a metadata entry
+QUEUED_NOTIFY_KINDS = frozenset({"reminder", "update", "cancellation"})
+
+
+async def _run_notification_job(job_key: str, kind: str, meeting: Meeting, body: NotifyRequest) -> None:
+    """Send queued notifications, then move the job record from queued to sent or failed"""
+    send, _ = NOTIFY_DISPATCH[kind]
+    try:
+        results = await send(meeting, body)
+        value = {
+            "status": "sent",
+            "meeting_id": str(meeting.id),
+            "kind": kind,
+            "sent": sum(1 for success in results.values() if success),
+            "total": len(meeting.participants),
+            "results": results,
+        }
+    except Exception as exc:
+        logger.exception("Notification job %s failed", job_key)
+        value = {"status": "failed", "meeting_id": str(meeting.id), "kind": kind, "error": str(exc)}
+    await metadata_service.update_metadata(
+        key=job_key,
+        value=value,
+        metadata_type="notification_job",
+        description=f"{kind} notifications",
+    )
+
+
+@app.post("/api/meetings/{meeting_id}/notify/{kind}")
+async def notify_participants(
+    meeting_id: str,
+    kind: NotificationKind,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+    body: Optional[NotifyRequest] = None,
+):
+    """Send one kind of notification for a meeting to all participants.
+
+    Invitations are sent before responding. Reminders, updates and cancellations are
+    queued; the response names the metadata key where the outcome is recorded.
+    """
+    body = body or NotifyRequest()
+    if kind == "update" and body.changes_description is None:
+        raise HTTPException(status_code=400, detail="changes_description is required")
+    if kind == "cancellation" and body.cancellation_reason is None:
+        raise HTTPException(status_code=400, detail="cancellation_reason is required")
+
+    meeting = await meeting_service.get_meeting(meeting_id, ttl_ms=MEETING_CACHE_TTL_MS)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(meeting, current_user)
-    
-    # Send invitations to all participants
-    results = await notification_service.send_bulk_invitations(meeting)
-    
+
+    if kind in QUEUED_NOTIFY_KINDS:
+        job_key = f"{NOTIFICATION_JOB_KEY_PREFIX}{meeting_id}:{kind}:{time.time_ns()}"
+        # Recorded before responding, so the returned key resolves while the job runs
+        await metadata_service.create_metadata(
+            key=job_key,
+            value={"status": "queued", "meeting_id": meeting_id, "kind": kind, "total": len(meeting.participants)},
+            metadata_type="notification_job",
+            description=f"{kind} notifications",
+        )
+        background.add_task(_run_notification_job, job_key, kind, meeting, body)
+        return {"status": "queued", "participants": len(meeting.participants), "job": job_key}
+
+    send, label = NOTIFY_DISPATCH[kind]
+    results = await send(meeting, body)
+
     successful_sends = sum(1 for success in results.values() if success)
     total_participants = len(meeting.participants)
-    
+
     return {
-        "message": f"Invitations sent to {successful_sends}/{total_participants} participants",
+        "message": f"{label} sent to {successful_sends}/{total_participants} participants",
         "results": results
     }
 
+# The per-kind routes below predate /notify/{kind} and stay for existing clients
+
+@app.post("/api/meetings/{meeting_id}/send-invitation")
+async def send_invitation(meeting_id: str, current_user: CurrentUser, background: BackgroundTasks):
+    """Send invitation for a meeting to all participants"""
+    return await notify_participants(meeting_id, "invitation", current_user, background)
+
 @app.post("/api/meetings/{meeting_id}/send-reminder")
-async def send_reminder(meeting_id: str, current_user: CurrentUser):
-    """Send reminder for a meeting to all participants"""
-    meeting = await meeting_service.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    _ensure_meeting_owner(meeting, current_user)
-    
-    # Send reminders to all participants
-    results = await notification_service.send_bulk_reminders(meeting, hours_before=1)
-    
-    successful_sends = sum(1 for success in results.values() if success)
-    total_participants = len(meeting.participants)
-    
-    return {
-        "message": f"Reminders sent to {successful_sends}/{total_participants} participants",
-        "results": results
-    }
+async def send_reminder(meeting_id: str, current_user: CurrentUser, background: BackgroundTasks):
+    """Queue a reminder for a meeting to all participants"""
+    return await notify_participants(meeting_id, "reminder", current_user, background)
 
 @app.post("/api/meetings/{meeting_id}/send-update")
-async def send_update_notification(meeting_id: str, request: UpdateNotificationRequest, current_user: CurrentUser):
-    """Send update notification for a meeting to all participants"""
-    meeting = await meeting_service.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    _ensure_meeting_owner(meeting, current_user)
-    
-    # Send update notifications to all participants
-    results = {}
-    for participant in meeting.participants:
-        results[participant.email] = await notification_service.send_meeting_update(
-            meeting, participant, request.changes_description
-        )
-    
-    successful_sends = sum(1 for success in results.values() if success)
-    total_participants = len(meeting.participants)
-    
-    return {
-        "message": f"Update notifications sent to {successful_sends}/{total_participants} participants",
-        "results": results
-    }
+async def send_update_notification(
+    meeting_id: str,
+    request: UpdateNotificationRequest,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+):
+    """Queue an update notification for a meeting to all participants"""
+    body = NotifyRequest(changes_description=request.changes_description)
+    return await notify_participants(meeting_id, "update", current_user, background, body)
 
 @app.post("/api/meetings/{meeting_id}/send-cancellation")
-async def send_cancellation_notification(meeting_id: str, request: CancellationNotificationRequest, current_user: CurrentUser):
-    """Send cancellation notification for a meeting to all participants"""
-    meeting = await meeting_service.get_meeting(meeting_id)
-    if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    _ensure_meeting_owner(meeting, current_user)
-    
-    # Send cancellation notifications to all participants
-    results = {}
-    for participant in meeting.participants:
-        results[participant.email] = await notification_service.send_meeting_cancellation(
-            meeting, participant, request.cancellation_reason
-        )
-    
-    successful_sends = sum(1 for success in results.values() if success)
-    total_participants = len(meeting.participants)
-    
-    return {
-        "message": f"Cancellation notifications sent to {successful_sends}/{total_participants} participants",
-        "results": results
-    }
+async def send_cancellation_notification(
+    meeting_id: str,
+    request: CancellationNotificationRequest,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+):
+    """Queue a cancellation notification for a meeting to all participants"""
+    body = NotifyRequest(cancellation_reason=request.cancellation_reason)
+    return await notify_participants(meeting_id, "cancellation", current_user, background, body)
 
 @app.post("/api/meetings/{meeting_id}/generate-meet-link", response_model=Meeting)
 async def generate_meet_link(meeting_id: str, current_user: CurrentUser):
     """Generate and attach a Google Meet link for a meeting"""
     existing = await meeting_service.get_meeting(meeting_id)
     if not existing:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(existing, current_user)
     meeting = await meeting_service.generate_meet_link(meeting_id)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    return meeting
+        return _meeting_not_found()
+    return _json_response(meeting)
 
 @app.post("/api/meetings/{meeting_id}/create-google-event", response_model=Meeting)
 async def create_google_event(meeting_id: str, current_user: CurrentUser):
     """Create a Google Calendar event with a Meet link for this meeting"""
     meeting = await meeting_service.get_meeting(meeting_id)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(meeting, current_user)
 
     user = current_user
@@ -1178,9 +1464,8 @@ async def create_google_event(meeting_id: str, current_user: CurrentUser):
         raise HTTPException(status_code=400, detail="Google account not connected")
 
     attendees = [p.email for p in meeting.participants]
-    event_timezone = os.getenv("DEFAULT_TIMEZONE", "UTC")
+    event_timezone = DEFAULT_TIMEZONE
     try:
-        from functools import partial
         create_fn = partial(
             create_event_with_meet,
             creds,
@@ -1195,57 +1480,48 @@ async def create_google_event(meeting_id: str, current_user: CurrentUser):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create Google event: {e}")
 
-    meta = dict(meeting.metadata or {})
-    meta["meeting_platform"] = "google_meet"
+    meta_fields: Dict[str, Any] = {"meeting_platform": "google_meet"}
     if created.meet_url:
-        meta["meeting_url"] = created.meet_url
+        meta_fields["meeting_url"] = created.meet_url
     if created.event_id:
-        meta["google_event_id"] = created.event_id
+        meta_fields["google_event_id"] = created.event_id
     if created.html_link:
-        meta["google_event_link"] = created.html_link
+        meta_fields["google_event_link"] = created.html_link
 
-    updated = await meeting_service.update_meeting_metadata(meeting_id, meta)
-    return updated or meeting
+    updated = await meeting_service.set_meeting_metadata_fields(meeting_id, meta_fields)
+    return _json_response(updated or meeting)
 
 @app.post("/api/meetings/{meeting_id}/participants", response_model=Meeting)
-async def add_meeting_participants(meeting_id: str, request: AddParticipantsRequest, current_user: CurrentUser):
+async def add_meeting_participants(
+    meeting_id: str,
+    request: AddParticipantsRequest,
+    current_user: CurrentUser,
+    background: BackgroundTasks,
+):
     """Add participants to a meeting and update Google Calendar event if present"""
     if not request.emails:
         raise HTTPException(status_code=400, detail="No emails provided")
 
     existing_meeting = await meeting_service.get_meeting(meeting_id)
     if not existing_meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     _ensure_meeting_owner(existing_meeting, current_user)
 
-    if existing_meeting.status == "completed" or existing_meeting.end_time <= datetime.now(timezone.utc):
+    if existing_meeting.status == "completed" or existing_meeting.end_time.timestamp() <= time.time():
         raise HTTPException(status_code=400, detail="Cannot modify a completed meeting.")
 
     meeting = await meeting_service.add_participants(meeting_id, request.emails)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
 
-    # Try to update Google Calendar attendees if event exists and user connected Google
+    # Update Google Calendar attendees after responding if an event exists
     google_event_id = (meeting.metadata or {}).get("google_event_id")
-    if google_event_id:
-        try:
-            user = current_user
-            creds = (user.preferences or {}).get("google_credentials") if user else None
-            if creds:
-                from functools import partial
-                emails = [p.email for p in meeting.participants]
-                update_fn = partial(
-                    update_event_attendees,
-                    creds,
-                    event_id=google_event_id,
-                    attendees=emails,
-                    send_updates="all",
-                )
-                await anyio.to_thread.run_sync(update_fn)
-        except Exception as e:
-            print(f"Google event attendee update failed: {e}")
+    creds = (current_user.preferences or {}).get("google_credentials")
+    if google_event_id and creds:
+        emails = [p.email for p in meeting.participants]
+        background.add_task(_sync_google_attendees, creds, {google_event_id: emails})
 
-    return meeting
+    return _json_response(meeting)
 
 
 @app.post("/api/meetings/{meeting_id}/polls")
@@ -1254,7 +1530,7 @@ async def create_poll(meeting_id: str, request: CreatePollRequest, current_user:
         raise HTTPException(status_code=503, detail="Poll service unavailable")
     meeting = await meeting_service.get_meeting(meeting_id)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     if not request.options:
         raise HTTPException(status_code=400, detail="At least one option is required")
 
@@ -1262,7 +1538,7 @@ async def create_poll(meeting_id: str, request: CreatePollRequest, current_user:
         {"start_time": opt.start_time, "end_time": opt.end_time}
         for opt in request.options
     ]
-    normalized_deadline = _ensure_tz(request.deadline) if request.deadline else None
+    normalized_deadline = as_utc(request.deadline) if request.deadline else None
     poll = await poll_service.create_poll(
         meeting_id=meeting_id,
         organizer_email=current_user.email,
@@ -1270,16 +1546,17 @@ async def create_poll(meeting_id: str, request: CreatePollRequest, current_user:
         deadline=normalized_deadline,
     )
 
-    meta = dict(meeting.metadata or {})
-    meta["poll_id"] = str(poll.id)
-    await meeting_service.update_meeting_metadata(meeting_id, meta)
+    await meeting_service.set_meeting_metadata_fields(meeting_id, {"poll_id": str(poll.id)})
 
     poll_id_str = str(poll.id)
-    base_poll_url = f"{os.getenv('FRONTEND_URL', 'http://localhost:3000')}/poll/{poll_id_str}"
-    for participant in meeting.participants:
+    base_poll_url = f"{FRONTEND_URL}/poll/{poll_id_str}"
+
+    async def _invite(participant: Participant) -> bool:
         token = generate_poll_token(poll_id_str, participant.email, poll.deadline)
         participant_poll_url = f"{base_poll_url}?token={quote(token)}"
-        await notification_service.send_poll_invitation(meeting, participant, participant_poll_url)
+        return await notification_service.send_poll_invitation(meeting, participant, participant_poll_url)
+
+    await notification_service.send_to_participants(meeting.participants, _invite)
 
     return poll
 
@@ -1287,9 +1564,9 @@ async def create_poll(meeting_id: str, request: CreatePollRequest, current_user:
 @app.get("/api/meetings/{meeting_id}/polls")
 async def get_meeting_polls(meeting_id: str, current_user: OptionalCurrentUser = None):
     """Get all polls for a meeting"""
-    meeting = await meeting_service.get_meeting(meeting_id)
+    meeting = await meeting_service.get_meeting(meeting_id, ttl_ms=MEETING_CACHE_TTL_MS)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
+        return _meeting_not_found()
     
     polls = await poll_service.get_polls_for_meeting(meeting_id)
     
@@ -1391,12 +1668,12 @@ async def create_metadata(
     return await metadata_service.create_metadata(key, value, metadata_type, description)
 
 @app.get("/api/metadata/{key}", response_model=Metadata)
-async def get_metadata(key: str, current_user: CurrentUser):
+async def get_metadata(key: str, current_user: CurrentUser, loader: MetadataLoaderDep):
     """Get metadata by key"""
-    metadata = await metadata_service.get_metadata(key)
+    metadata = await loader.load(key)
     if not metadata:
         raise HTTPException(status_code=404, detail="Metadata not found")
-    return metadata
+    return _json_response(metadata)
 
 @app.get("/api/metadata", response_model=List[Metadata])
 async def get_all_metadata(current_user: CurrentUser):
@@ -1436,23 +1713,22 @@ async def delete_metadata(key: str, current_user: CurrentUser):
 @app.put("/api/meetings/{meeting_id}/metadata")
 async def update_meeting_metadata(
     meeting_id: str,
-    metadata: Dict[str, Any],
+    metadata: dict,
     current_user: CurrentUser,
 ):
     """Update meeting metadata"""
     meeting = await meeting_service.update_meeting_metadata(meeting_id, metadata)
     if not meeting:
-        raise HTTPException(status_code=404, detail="Meeting not found")
-    return meeting
+        return _meeting_not_found()
+    return _json_response(meeting)
 
 # Duplicate/broken poll endpoints removed - use the working endpoints above (lines 1265-1407)
 
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     # Log the requested path for debugging
-    print(f"404 Error: Requested path: {request.url.path}")
-    print(f"404 Error: Full URL: {request.url}")
-    return JSONResponse(
+    logger.info("404 Error: Requested path: %s", request.url.path)
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Resource not found",
@@ -1471,7 +1747,7 @@ async def not_found_handler(request, exc):
 
 @app.exception_handler(500)
 async def internal_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"error": "Internal server error"}
     )
@@ -1481,7 +1757,9 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=int(os.getenv("PORT", 8000)),
-        reload=True
+        reload=True,
+        loop="uvloop",
+        http="httptools",
     )
 def _serialize_poll(poll: Poll, meeting: Optional[Meeting] = None, viewer_email: Optional[str] = None) -> Dict[str, Any]:
     poll_dict = poll.model_dump(mode="json")
@@ -1501,9 +1779,7 @@ def _serialize_poll(poll: Poll, meeting: Optional[Meeting] = None, viewer_email:
         poll_dict["viewer_vote_option_id"] = viewer_vote
     else:
         poll_dict["viewer_vote_option_id"] = None
-    deadline_dt = poll.deadline
-    if deadline_dt and deadline_dt.tzinfo is None:
-        deadline_dt = deadline_dt.replace(tzinfo=timezone.utc)
+    deadline_dt = as_utc(poll.deadline) if poll.deadline else None
     poll_dict["is_deadline_passed"] = bool(
         deadline_dt and datetime.now(timezone.utc) >= deadline_dt
     )
@@ -0,0 +1,16 @@
+from uvicorn.workers import UvicornWorker
+
+
+class Worker(UvicornWorker):
+    """UvicornWorker pinned to uvloop/httptools, without access log or Server header.
+
+    gunicorn's accesslog setting does not stop uvicorn from formatting access lines
+    (they propagate to the root logger), so it is switched off here instead.
+    """
+
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "access_log": False,
+        "server_header": False,
+    }